@@ -50,6 +50,7 @@ class ProgressDialog:
             self.cancel_button.pack(pady=10)
         
         self.cancelled = False
+        self._drawn_percentage = None  # Last whole percentage drawn on the bar
         
         # Handle window close event
         self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
@@ -65,6 +66,12 @@ class ProgressDialog:
                 # Called with separate parameters (percentage, status_text)
                 self.progress_bar['value'] = progress_or_percentage
                 self.message_label.config(text=status_text)
+            elif isinstance(progress_or_percentage, (int, float)):
+                # Called with a bare percentage; skip redraws within the same whole percent
+                drawn = int(progress_or_percentage)
+                if drawn != self._drawn_percentage:
+                    self._drawn_percentage = drawn
+                    self.progress_bar['value'] = progress_or_percentage
             else:
                 # Called with ProgressInfo object
                 progress_info = progress_or_percentage
@@ -16,7 +16,7 @@ def start_detection(self, event=None):
         
         try:
             # Check if this will create a new analysis or add to existing
-            analysis_info = self.check_existing_analysis(self.video_path)
+            analysis_info = self.check_analysis_exists(self.video_path)
             
             if analysis_info["exists"]:
                 # Confirm if user wants to create additional analysis
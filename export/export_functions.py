@@ -143,6 +143,8 @@ def export_results(self, event=None):
                     elif export_type.get() == "summary":
                         self.export_summary_csv(events, video_path, roi_data, polygon_data, user_choice)
                     
+                    self.invalidate_analysis_cache(video_path)
+                    
                 except Exception as e:
                     messagebox.showerror("Export-Fehler", f"Fehler beim CSV-Export: {str(e)}")
             
@@ -477,6 +479,7 @@ def export_pdf_report(self, event=None):
                 # Error occurred
                 self.update_status("Fehler beim Erstellen des PDF-Berichts")
             elif result:
+                self.invalidate_analysis_cache(video_path)
                 self.update_status("PDF-Bericht erfolgreich erstellt")
                 messagebox.showinfo("PDF erstellt", 
                                   f"PDF-Bericht wurde erfolgreich erstellt:\n{result}")
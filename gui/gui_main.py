@@ -629,8 +629,9 @@ class BatDetectorApp:
     def show_results_access_window(self, video_folders, results_dir):
         return results_mgmt.show_results_access_window(self, video_folders, results_dir)
 
-    def create_result_folder_card(self, parent, folder_name, folder_path, index, access_window):
-        return results_mgmt.create_result_folder_card(self, parent, folder_name, folder_path, index, access_window)
+    def create_result_folder_card(self, parent, folder_name, folder_path, index, access_window, mod_time=None):
+        return results_mgmt.create_result_folder_card(self, parent, folder_name, folder_path, index, access_window,
+                                                      mod_time)
 
     def analyze_folder_files(self, folder_path):
         return results_mgmt.analyze_folder_files(self, folder_path)
@@ -663,8 +664,8 @@ class BatDetectorApp:
     def load_folder_results_for_analysis(self, folder_path, folder_name, parent_window):
         return results_mgmt.load_folder_results_for_analysis(self, folder_path, folder_name, parent_window)
 
-    def refresh_results_window(self):
-        return results_mgmt.refresh_results_window(self)
+    def refresh_results_window(self, window, results_dir):
+        return results_mgmt.refresh_results_window(self, window, results_dir)
 
     def load_previous_video_results(self, event=None):
         return results_mgmt.load_previous_video_results(self, event)
@@ -745,6 +746,12 @@ class BatDetectorApp:
     def check_existing_analysis(self, video_path=None):
         return session_mgmt.check_existing_analysis(self, video_path)
 
+    def check_analysis_exists(self, video_path):
+        return session_mgmt.check_analysis_exists(self, video_path)
+
+    def invalidate_analysis_cache(self, video_path=None):
+        return session_mgmt.invalidate_analysis_cache(self, video_path)
+
     def show_analysis_history_dialog(self, analysis_info):
         return session_mgmt.show_analysis_history_dialog(self, analysis_info)
 
@@ -760,8 +767,11 @@ class BatDetectorApp:
     def show_enhanced_event_viewer(self, events, session_info=None):
         return session_mgmt.show_enhanced_event_viewer(self, events, session_info)
 
-    def navigate_to_event(self, event_data):
-        return session_mgmt.navigate_to_event(self, event_data)
+    def navigate_to_event(self, event_data, exact=True):
+        return session_mgmt.navigate_to_event(self, event_data, exact)
+
+    def clear_video_caches(self):
+        return session_mgmt.clear_video_caches(self)
 
     def refresh_event_points(self):
         return session_mgmt.refresh_event_points(self)
@@ -1,10 +1,47 @@
 
 
+import functools
+import importlib.util
+import logging
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import messagebox, ttk
-import cv2
-from datetime import datetime
+import time
+
+from utils.result_organizer import create_video_result_structure, get_video_name_from_path
+from utils.tk_helpers import attach_scroll_paging, load_in_background, screen_size
+from validation.persistent_validator import EventPointCapture, PersistentValidationManager
+
+logger = logging.getLogger(__name__)
+
+# PyAV decodes keyframe previews while browsing the event list (optional).
+# Only probed here - the native library is imported when a container is opened.
+PYAV_AVAILABLE = importlib.util.find_spec('av') is not None
+
+# Bound on first use - the PDF module pulls in reportlab and OpenCV
+_parse_datetime_from_filename = None
+
+# Decoded event frames kept for revisiting recent events (full frames, so keep it small)
+_FRAME_CACHE_SIZE = 16
+
+# Forward distance (frames) up to which the OpenCV fallback walks with grab() instead of seeking
+_GRAB_SEEK_WINDOW = 30
+
+# Bound formatter for the seconds columns of the event viewer
+_format_seconds = "{:.2f}".format
+
+# Display format for file modification times
+_MTIME_FORMAT = "%d.%m.%Y %H:%M"
+
+# Labels for the file buckets returned by check_existing_analysis
+_FILE_TYPE_LABELS = {
+    'csv': '📊 CSV-Daten',
+    'pdf': '📄 PDF-Bericht',
+    'videos': '🎥 Markiertes Video'
+}
 
 # Fix matplotlib font issues on Windows
 
@@ -12,89 +49,186 @@ from datetime import datetime
 
 
 
+def _classify_analysis_file(name):
+    """Return the analysis bucket ('csv', 'pdf', 'videos') for a file name, or None"""
+    # Only lower-case the short slices that are compared, not the whole name
+    tail = name[-4:].lower()
+    if tail == '.csv':
+        return 'csv'
+    if tail == '.pdf':
+        return 'pdf'
+    if tail == '.avi' and name[:12].lower() == 'marked_video':
+        return 'videos'
+    return None
+
 def check_existing_analysis(self, video_path):
     """Check if a video has been analyzed before and return analysis information"""
     try:
-        from utils.result_organizer import create_video_result_structure
-        
         # Get the expected result folder for this video (checking only, no creation)
         structure = create_video_result_structure(video_path, user_choice=None)
         result_folder = structure["base"]
         
+        # Reuse the previous scan while the folder is unchanged (also caches "not analyzed")
+        if not hasattr(self, '_analysis_info_cache'):
+            self._analysis_info_cache = {}
+        try:
+            folder_mtime = os.stat(result_folder).st_mtime_ns
+        except OSError:
+            folder_mtime = None
+        cached = self._analysis_info_cache.get(video_path)
+        if cached is not None and cached[0] == folder_mtime:
+            return _copy_analysis_info(cached[1])
+        
         analysis_info = {
             "exists": False,
             "folder_path": result_folder,
             "video_name": structure["video_name"],
             "files": {},
             "analysis_count": 0,
-            "last_analysis": None
+            "last_analysis": None,
+            "file_mtimes": {}
         }
         
-        if not os.path.exists(result_folder):
-            return analysis_info
-        
-        # Check for analysis files
+        if folder_mtime is None:
+            self._analysis_info_cache[video_path] = (None, analysis_info)
+            return _copy_analysis_info(analysis_info)
         
-        # Look for CSV files
+        # Collect analysis files in a single directory pass
         csv_files = []
-        for file in os.listdir(result_folder):
-            if file.lower().endswith('.csv'):
-                csv_files.append(file)
-                
-        # Look for PDF reports
         pdf_files = []
-        for file in os.listdir(result_folder):
-            if file.lower().endswith('.pdf'):
-                pdf_files.append(file)
-                
-        # Look for marked videos
         video_files = []
-        for file in os.listdir(result_folder):
-            if file.lower().startswith('marked_video') and file.lower().endswith('.avi'):
-                video_files.append(file)
+        file_mtimes = analysis_info["file_mtimes"]
+        latest_mtime = -1.0
+        with os.scandir(result_folder) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                file = entry.name
+                file_type = _classify_analysis_file(file)
+                if file_type == 'csv':
+                    csv_files.append(file)
+                elif file_type == 'pdf':
+                    pdf_files.append(file)
+                elif file_type == 'videos':
+                    video_files.append(file)
+                else:
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                file_mtimes[file] = mtime
+                if mtime > latest_mtime:
+                    latest_mtime = mtime
         
         if csv_files or pdf_files or video_files:
             analysis_info["exists"] = True
             analysis_info["files"]["csv"] = csv_files
             analysis_info["files"]["pdf"] = pdf_files
             analysis_info["files"]["videos"] = video_files
-            analysis_info["analysis_count"] = len(set(csv_files + pdf_files + video_files))
+            analysis_info["analysis_count"] = len(csv_files) + len(pdf_files) + len(video_files)
             
-            # Get last modification time
-            try:
-                all_files = csv_files + pdf_files + video_files
-                if all_files:
-                    latest_file = max(all_files, key=lambda f: os.path.getmtime(os.path.join(result_folder, f)))
-                    analysis_info["last_analysis"] = datetime.fromtimestamp(
-                        os.path.getmtime(os.path.join(result_folder, latest_file))
-                    ).strftime("%d.%m.%Y %H:%M")
-            except:
+            # Last modification time was tracked during the scan
+            if latest_mtime >= 0:
+                analysis_info["last_analysis"] = time.strftime(_MTIME_FORMAT, time.localtime(latest_mtime))
+            else:
                 analysis_info["last_analysis"] = "Unbekannt"
         
-        return analysis_info
+        self._analysis_info_cache[video_path] = (folder_mtime, analysis_info)
+        return _copy_analysis_info(analysis_info)
         
     except Exception as e:
-        print(f"[ERROR] Failed to check existing analysis: {e}")
-        return {"exists": False, "folder_path": None, "video_name": None, "files": {}, "analysis_count": 0, "last_analysis": None}
+        logger.error("Failed to check existing analysis: %s", e)
+        return {"exists": False, "folder_path": None, "video_name": None, "files": {}, "analysis_count": 0, "last_analysis": None,
+                "file_mtimes": {}}
 
-def show_analysis_history_dialog(self, analysis_info):
-    """Show dialog with existing analysis information and options"""
-    dialog = tk.Toplevel(self.root)
-    dialog.title("Vorherige Analyse gefunden")
-    
-    # Make dialog larger to show all content including bottom buttons
-    dialog.geometry("750x650")
-    dialog.minsize(650, 550)  # Set minimum size
-    dialog.resizable(True, True)  # Allow resizing for different screen sizes
-    dialog.transient(self.root)
+def check_analysis_exists(self, video_path):
+    """Cheap probe whether a video has analysis results, without collecting file details"""
+    try:
+        structure = create_video_result_structure(video_path, user_choice=None)
+        result_folder = structure["base"]
+        exists = False
+        try:
+            with os.scandir(result_folder) as entries:
+                for entry in entries:
+                    if _classify_analysis_file(entry.name) is not None:
+                        if entry.is_file():
+                            exists = True
+                            break
+        except OSError:
+            pass
+        return {"exists": exists, "folder_path": result_folder, "video_name": structure["video_name"]}
+    except Exception as e:
+        logger.error("Failed to check existing analysis: %s", e)
+        return {"exists": False, "folder_path": None, "video_name": None}
+
+def _copy_analysis_info(analysis_info):
+    """Return a copy of cached analysis info that callers may modify freely"""
+    info = dict(analysis_info)
+    info["files"] = {file_type: list(files) for file_type, files in analysis_info["files"].items()}
+    info["file_mtimes"] = dict(analysis_info["file_mtimes"])
+    return info
+
+def invalidate_analysis_cache(self, video_path=None):
+    """Drop cached analysis info after new result files were written for a video"""
+    cache = getattr(self, '_analysis_info_cache', None)
+    if not cache:
+        return
+    if video_path is None:
+        cache.clear()
+    else:
+        cache.pop(video_path, None)
+
+def _bind_mousewheel_recursive(widget, handler):
+    """Bind <MouseWheel> on a widget and all of its descendants"""
+    try:
+        widget.bind("<MouseWheel>", handler)
+        for child in widget.winfo_children():
+            _bind_mousewheel_recursive(child, handler)
+    except tk.TclError:
+        pass  # Widget destroyed before binding
+
+def _make_scrollable_dialog(parent, title, screen_size, preferred=(750, 650), min_size=(650, 550),
+                            padding=15, with_button_area=False):
+    """Create a modal, centered dialog with a scrollable content area
+    
+    Returns:
+        tuple: (dialog, main_frame, button_container) - button_container is a
+        fixed frame below the scrollable area, or None if not requested
+    """
+    dialog = tk.Toplevel(parent)
+    dialog.title(title)
+    dialog.transient(parent)
     dialog.grab_set()
     
+    # Responsive sizing based on screen dimensions
+    screen_width, screen_height = screen_size
+    dialog_width = min(preferred[0], int(screen_width * 0.85))
+    dialog_height = min(preferred[1], int(screen_height * 0.85))
+    dialog.minsize(*min_size)
+    dialog.resizable(True, True)
+    
     # Center the dialog
-    dialog.geometry("+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50))
+    x = (screen_width - dialog_width) // 2
+    y = (screen_height - dialog_height) // 2
+    dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+    
+    # Configure grid layout for responsiveness
+    dialog.grid_rowconfigure(0, weight=1)  # Main content area
+    if with_button_area:
+        dialog.grid_rowconfigure(1, weight=0)  # Button area (fixed)
+    dialog.grid_columnconfigure(0, weight=1)
+    
+    # Create main container frame
+    main_container = ttk.Frame(dialog)
+    main_container.grid(row=0, column=0, sticky="nsew", padx=10,
+                        pady=(10, 0) if with_button_area else 10)
+    main_container.grid_rowconfigure(0, weight=1)
+    main_container.grid_columnconfigure(0, weight=1)
     
-    # Create a main container with scrollable capability
-    canvas = tk.Canvas(dialog)
-    scrollbar = ttk.Scrollbar(dialog, orient="vertical", command=canvas.yview)
+    # Create scrollable content area
+    canvas = tk.Canvas(main_container)
+    scrollbar = ttk.Scrollbar(main_container, orient="vertical", command=canvas.yview)
     scrollable_frame = ttk.Frame(canvas)
     
     scrollable_frame.bind(
@@ -111,26 +245,30 @@ def show_analysis_history_dialog(self, analysis_info):
                 canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
         except tk.TclError:
             pass
-
-    def _bind_to_mousewheel(event):
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
     
-    def _unbind_from_mousewheel(event):
-        try:
-            canvas.unbind_all("<MouseWheel>")
-        except tk.TclError:
-            pass
-    
-    canvas.bind('<Enter>', _bind_to_mousewheel)
-    canvas.bind('<Leave>', _unbind_from_mousewheel)
+    # Bind the wheel on this dialog's widgets only (once its content exists),
+    # so stacked dialogs don't overwrite a global binding
+    dialog.after_idle(_bind_mousewheel_recursive, canvas, _on_mousewheel)
     
-    # Pack scrolling elements
-    canvas.pack(side="left", fill="both", expand=True)
-    scrollbar.pack(side="right", fill="y")
+    # Grid layout for scrollable area
+    canvas.grid(row=0, column=0, sticky="nsew")
+    scrollbar.grid(row=0, column=1, sticky="ns")
     
-    main_frame = ttk.Frame(scrollable_frame, padding=15)
+    main_frame = ttk.Frame(scrollable_frame, padding=padding)
     main_frame.pack(fill=tk.BOTH, expand=True)
     
+    button_container = None
+    if with_button_area:
+        button_container = ttk.Frame(dialog)
+        button_container.grid(row=1, column=0, sticky="ew", padx=20, pady=15)
+    
+    return dialog, main_frame, button_container
+
+def show_analysis_history_dialog(self, analysis_info):
+    """Show dialog with existing analysis information and options"""
+    dialog, main_frame, _ = _make_scrollable_dialog(self.root, "Vorherige Analyse gefunden",
+                                                    screen_size(self))
+    
     # Title
     title_label = ttk.Label(main_frame, text="Video bereits analysiert!", 
                             font=('Arial', 14, 'bold'), foreground="#2B5D8A")
@@ -170,25 +308,40 @@ def show_analysis_history_dialog(self, analysis_info):
     tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     scrollbar_tree.pack(side=tk.RIGHT, fill=tk.Y)
     
-    # Populate tree with files
-    file_types = {
-        'csv': ('📊 CSV-Daten', '#4CAF50'),
-        'pdf': ('📄 PDF-Bericht', '#F44336'),
-        'videos': ('🎥 Markiertes Video', '#2196F3')
-    }
-    
-    for file_type, files in analysis_info['files'].items():
-        if files:
-            type_info = file_types.get(file_type, ('📁 Datei', '#666666'))
-            for file in files:
-                try:
-                    file_path = os.path.join(analysis_info['folder_path'], file)
-                    mod_time = datetime.fromtimestamp(os.path.getmtime(file_path)).strftime("%d.%m.%Y %H:%M")
-                    tree.insert('', 'end', text=file, values=(type_info[0], mod_time), 
-                                tags=(file_type,))
-                except:
-                    tree.insert('', 'end', text=file, values=(type_info[0], "Unbekannt"), 
-                                tags=(file_type,))
+    # Populate tree with files in the background so the dialog opens immediately
+    placeholder = tree.insert('', 'end', text='Lade Dateien…', values=('', ''))
+    
+    def _flush(rows):
+        nonlocal placeholder
+        try:
+            if not tree.winfo_exists():
+                return
+            if placeholder is not None:
+                tree.delete(placeholder)
+                placeholder = None
+            insert = tree.insert
+            for file, values, tags in rows:
+                insert('', 'end', text=file, values=values, tags=tags)
+        except tk.TclError:
+            pass  # Dialog closed while rows were loading
+    
+    def _rows():
+        # Modification times were recorded by check_existing_analysis; only formatting is left
+        mtimes = analysis_info.get('file_mtimes', {})
+        for file_type, files in analysis_info['files'].items():
+            if files:
+                # Per-type label and tags are shared by every row of the bucket
+                type_label = _FILE_TYPE_LABELS.get(file_type, '📁 Datei')
+                tags = (file_type,)
+                for file in files:
+                    mtime = mtimes.get(file)
+                    if mtime is not None:
+                        mod_time = time.strftime(_MTIME_FORMAT, time.localtime(mtime))
+                    else:
+                        mod_time = "Unbekannt"
+                    yield file, (type_label, mod_time), tags
+    
+    load_in_background(self.root, _rows, _flush)
                     
     # Configure tree colors
     tree.tag_configure('csv', foreground='#2E7D32')
@@ -245,73 +398,7 @@ def show_analysis_history_dialog(self, analysis_info):
 
 def show_folder_choice_dialog(self, video_name, existing_folder_info):
     """Show dialog for choosing how to handle existing result folder"""
-    dialog = tk.Toplevel(self.root)
-    dialog.title("Ordner-Optionen")
-    dialog.transient(self.root)
-    dialog.grab_set()
-    
-    # Responsive sizing based on screen dimensions
-    screen_width = dialog.winfo_screenwidth()
-    screen_height = dialog.winfo_screenheight()
-    dialog_width = min(750, int(screen_width * 0.85))
-    dialog_height = min(650, int(screen_height * 0.85))
-    dialog.geometry(f"{dialog_width}x{dialog_height}")
-    dialog.minsize(650, 550)
-    dialog.resizable(True, True)
-    
-    # Center the dialog
-    x = (screen_width - dialog_width) // 2
-    y = (screen_height - dialog_height) // 2
-    dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
-    
-    # Configure grid layout for responsiveness
-    dialog.grid_rowconfigure(0, weight=1)  # Main content area
-    dialog.grid_columnconfigure(0, weight=1)
-    
-    # Create main container frame
-    main_container = ttk.Frame(dialog)
-    main_container.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
-    main_container.grid_rowconfigure(0, weight=1)  # Content area
-    main_container.grid_columnconfigure(0, weight=1)
-    
-    # Create scrollable content area
-    canvas = tk.Canvas(main_container)
-    scrollbar = ttk.Scrollbar(main_container, orient="vertical", command=canvas.yview)
-    scrollable_frame = ttk.Frame(canvas)
-    
-    scrollable_frame.bind(
-        "<Configure>",
-        lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-    )
-    
-    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-    canvas.configure(yscrollcommand=scrollbar.set)
-    
-    def _on_mousewheel(event):
-        try:
-            if canvas.winfo_exists():
-                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        except tk.TclError:
-            pass
-    
-    def _bind_to_mousewheel(event):
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-    
-    def _unbind_from_mousewheel(event):
-        try:
-            canvas.unbind_all("<MouseWheel>")
-        except tk.TclError:
-            pass
-    
-    canvas.bind('<Enter>', _bind_to_mousewheel)
-    canvas.bind('<Leave>', _unbind_from_mousewheel)
-    
-    # Grid layout for scrollable area
-    canvas.grid(row=0, column=0, sticky="nsew")
-    scrollbar.grid(row=0, column=1, sticky="ns")
-    
-    main_frame = ttk.Frame(scrollable_frame, padding=15)
-    main_frame.pack(fill=tk.BOTH, expand=True)
+    dialog, main_frame, _ = _make_scrollable_dialog(self.root, "Ordner-Optionen", screen_size(self))
     
     # Title
     title_label = ttk.Label(main_frame, text="Ordner bereits vorhanden!", 
@@ -407,74 +494,8 @@ def show_folder_choice_dialog(self, video_name, existing_folder_info):
 
 def show_video_info_dialog(self, video_path):
     """Show single dialog for all video information input"""
-    dialog = tk.Toplevel(self.root)
-    dialog.title("Video-Informationen für PDF-Bericht")
-    dialog.transient(self.root)
-    dialog.grab_set()
-    
-    # Responsive sizing based on screen dimensions
-    screen_width = dialog.winfo_screenwidth()
-    screen_height = dialog.winfo_screenheight()
-    dialog_width = min(750, int(screen_width * 0.85))
-    dialog_height = min(650, int(screen_height * 0.85))
-    dialog.geometry(f"{dialog_width}x{dialog_height}")
-    dialog.minsize(650, 550)
-    dialog.resizable(True, True)
-    
-    # Center the dialog
-    x = (screen_width - dialog_width) // 2
-    y = (screen_height - dialog_height) // 2
-    dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
-    
-    # Configure grid layout for responsiveness
-    dialog.grid_rowconfigure(0, weight=1)  # Main content area
-    dialog.grid_rowconfigure(1, weight=0)  # Button area (fixed)
-    dialog.grid_columnconfigure(0, weight=1)
-    
-    # Create main container frame
-    main_container = ttk.Frame(dialog)
-    main_container.grid(row=0, column=0, sticky="nsew", padx=10, pady=(10, 0))
-    main_container.grid_rowconfigure(0, weight=1)
-    main_container.grid_columnconfigure(0, weight=1)
-    
-    # Create scrollable content area
-    canvas = tk.Canvas(main_container)
-    scrollbar = ttk.Scrollbar(main_container, orient="vertical", command=canvas.yview)
-    scrollable_frame = ttk.Frame(canvas)
-    
-    scrollable_frame.bind(
-        "<Configure>",
-        lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-    )
-    
-    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-    canvas.configure(yscrollcommand=scrollbar.set)
-    
-    def _on_mousewheel(event):
-        try:
-            if canvas.winfo_exists():
-                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        except tk.TclError:
-            pass
-
-    def _bind_to_mousewheel(event):
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-    
-    def _unbind_from_mousewheel(event):
-        try:
-            canvas.unbind_all("<MouseWheel>")
-        except tk.TclError:
-            pass
-    
-    canvas.bind('<Enter>', _bind_to_mousewheel)
-    canvas.bind('<Leave>', _unbind_from_mousewheel)
-    
-    # Grid layout for scrollable area
-    canvas.grid(row=0, column=0, sticky="nsew")
-    scrollbar.grid(row=0, column=1, sticky="ns")
-    
-    main_frame = ttk.Frame(scrollable_frame, padding=20)
-    main_frame.pack(fill=tk.BOTH, expand=True)
+    dialog, main_frame, button_container = _make_scrollable_dialog(
+        self.root, "Video-Informationen für PDF-Bericht", screen_size(self), padding=20, with_button_area=True)
     
     # Title
     title_label = ttk.Label(main_frame, text="PDF-Bericht Informationen", 
@@ -482,8 +503,10 @@ def show_video_info_dialog(self, video_path):
     title_label.pack(anchor=tk.W, pady=(0, 15))
     
     # Parse date and time from filename
-    from export.simple_pdf_report import parse_datetime_from_filename
-    parsed_date, parsed_time = parse_datetime_from_filename(video_path)
+    global _parse_datetime_from_filename
+    if _parse_datetime_from_filename is None:
+        from export.simple_pdf_report import parse_datetime_from_filename as _parse_datetime_from_filename
+    parsed_date, parsed_time = _parse_datetime_from_filename(video_path)
     video_name = os.path.splitext(os.path.basename(video_path))[0]
     
     # Video info display
@@ -602,8 +625,6 @@ def show_video_info_dialog(self, video_path):
         dialog.destroy()
     
     # Fixed button frame at bottom (outside scrollable area)
-    button_container = ttk.Frame(dialog)
-    button_container.grid(row=1, column=0, sticky="ew", padx=20, pady=15)
     button_container.grid_columnconfigure(1, weight=1)  # Spacer column
     
     # Add a separator line above buttons
@@ -638,17 +659,14 @@ def show_previous_events_enhanced(self):
             messagebox.showwarning("Kein Video", "Bitte laden Sie zuerst ein Video.")
             return
         
-        # Import event point capture
-        from validation.persistent_validator import EventPointCapture
-        event_capture = EventPointCapture(self.video_path)
+        event_capture = _get_event_capture(self.video_path)
         
         # Load event points for fast navigation
         event_points = event_capture.load_event_points()
         
         if not event_points or not event_points.get('events'):
             # Try to load from CSV if no event points available
-            from validation.persistent_validator import PersistentValidationManager
-            validator = PersistentValidationManager(self.video_path)
+            validator = _get_validator(self.video_path)
             
             if validator.load_events_from_csv():
                 # Capture event points from loaded events
@@ -673,8 +691,7 @@ def show_enhanced_event_viewer(self, event_points):
     viewer_window.transient(self.root)
     
     # Responsive sizing based on screen dimensions
-    screen_width = viewer_window.winfo_screenwidth()
-    screen_height = viewer_window.winfo_screenheight()
+    screen_width, screen_height = screen_size(self)
     window_width = min(800, int(screen_width * 0.85))
     window_height = min(600, int(screen_height * 0.85))
     viewer_window.geometry(f"{window_width}x{window_height}")
@@ -703,15 +720,23 @@ def show_enhanced_event_viewer(self, event_points):
     
     # Summary info
     events = event_points.get('events', [])
-    total_events = len(events)
-    total_duration = sum(event['duration'] for event in events)
+    total_events = 0
+    total_duration = 0.0
+    for event in events:
+        total_duration += event['duration']
+        total_events += 1
     
     info_frame = ttk.LabelFrame(main_frame, text="Übersicht", padding=10)
     info_frame.grid(row=1, column=0, sticky="ew", pady=(0, 15))
     
-    ttk.Label(info_frame, text=f"Gesamte Ereignisse: {total_events}").pack(anchor=tk.W)
-    ttk.Label(info_frame, text=f"Gesamtdauer: {total_duration:.1f} Sekunden").pack(anchor=tk.W)
-    ttk.Label(info_frame, text=f"Durchschnittsdauer: {total_duration/total_events:.1f} Sekunden" if total_events > 0 else "").pack(anchor=tk.W)
+    count_label = ttk.Label(info_frame, text=f"Gesamte Ereignisse: {total_events}")
+    count_label.pack(anchor=tk.W)
+    duration_label = ttk.Label(info_frame, text=f"Gesamtdauer: {total_duration:.1f} Sekunden")
+    duration_label.pack(anchor=tk.W)
+    average_label = [None]
+    if total_events:
+        average_label[0] = ttk.Label(info_frame, text=f"Durchschnittsdauer: {total_duration/total_events:.1f} Sekunden")
+        average_label[0].pack(anchor=tk.W)
     
     # Event list with fast navigation
     list_frame = ttk.LabelFrame(main_frame, text="Ereignisliste (Doppelklick für schnelle Navigation)", padding=10)
@@ -747,27 +772,121 @@ def show_enhanced_event_viewer(self, event_points):
     v_scrollbar.grid(row=0, column=1, sticky="ns")
     h_scrollbar.grid(row=1, column=0, sticky="ew")
     
-    # Populate event list
-    for event in events:
-        tree.insert('', tk.END, text=str(event['index'] + 1),
-                    values=(f"{event['start_time']:.2f}",
-                            f"{event['end_time']:.2f}",
-                            f"{event['duration']:.2f}",
-                            event.get('event_type', 'detection')))
-    
-    def on_event_double_click(event_item):
-        """Handle double-click on event for fast navigation"""
+    # Populate event list. Short lists are inserted at once while the tree is
+    # detached from the layout, so Tk lays it out once instead of once per row.
+    # Long lists are paged in as the user scrolls towards the end of the list.
+    # Row texts and value tuples are formatted once before any Tk call.
+    rows = []
+    
+    def _insert_row(_, row):
+        text, values = row
+        tree.insert('', tk.END, text=text, values=values)
+    
+    load_rows, reset_rows = attach_scroll_paging(tree, v_scrollbar, rows, _insert_row, 200)
+    
+    def _populate_tree():
+        """(Re)fill the tree from `events`"""
+        tree.delete(*tree.get_children())
+        fmt = _format_seconds
+        rows[:] = [(str(event['index'] + 1),
+                    (fmt(event['start_time']),
+                     fmt(event['end_time']),
+                     fmt(event['duration']),
+                     event.get('event_type', 'detection')))
+                   for event in events]
+        reset_rows()
+        if len(rows) > 1000:
+            load_rows()
+        else:
+            tree.grid_remove()
+            load_rows(len(rows))
+            tree.grid()
+    
+    def _update_summary():
+        count = len(events)
+        duration = 0.0
+        for event in events:
+            duration += event['duration']
+        count_label.config(text=f"Gesamte Ereignisse: {count}")
+        duration_label.config(text=f"Gesamtdauer: {duration:.1f} Sekunden")
+        if count:
+            if average_label[0] is None:
+                average_label[0] = ttk.Label(info_frame)
+                average_label[0].pack(anchor=tk.W)
+            average_label[0].config(text=f"Durchschnittsdauer: {duration/count:.1f} Sekunden")
+        elif average_label[0] is not None:
+            average_label[0].config(text="")
+    
+    def _repopulate():
+        _update_summary()
+        _populate_tree()
+    
+    _populate_tree()
+    
+    # Let refresh_event_points update this viewer in place
+    self._events_tree = tree
+    self._events_list = events
+    self._events_tree_repopulate = _repopulate
+    
+    def _selected_event():
         selection = tree.selection()
         if selection:
             item = tree.item(selection[0])
             event_index = int(item['text']) - 1
             
             if 0 <= event_index < len(events):
-                selected_event = events[event_index]
-                # Fast navigation to event
-                self.navigate_to_event(selected_event)
+                return events[event_index]
+        return None
+    
+    # Pending after() ids and the last event sought from this viewer, so bursts
+    # of selections/clicks collapse into one seek and repeats are dropped
+    pending_preview = [None]
+    pending_exact = [None]
+    last_target = [None]
+    
+    def _cancel(pending):
+        if pending[0] is not None:
+            viewer_window.after_cancel(pending[0])
+            pending[0] = None
+    
+    def on_event_select(event_item):
+        """Cheap keyframe preview while moving through the list; only the latest selection is sought"""
+        if not PYAV_AVAILABLE:
+            return  # Previews need PyAV; OpenCV would have to seek detector.cap for every row
+        selected_event = _selected_event()
+        if selected_event is None:
+            return
+        self._latest_seek_request = selected_event
+        _cancel(pending_preview)
+        
+        def _preview():
+            pending_preview[0] = None
+            target = self._latest_seek_request
+            if target is last_target[0]:
+                return
+            last_target[0] = target
+            self.navigate_to_event(target, exact=False)
+        
+        pending_preview[0] = viewer_window.after(120, _preview)
+    
+    def on_event_double_click(event_item):
+        """Handle double-click on event for exact navigation"""
+        selected_event = _selected_event()
+        if selected_event is None:
+            return
+        _cancel(pending_preview)
+        _cancel(pending_exact)
+        
+        def _navigate():
+            pending_exact[0] = None
+            last_target[0] = selected_event
+            self.navigate_to_event(selected_event)
+        
+        pending_exact[0] = viewer_window.after(80, _navigate)
                 
+    tree.bind('<<TreeviewSelect>>', on_event_select)
     tree.bind('<Double-1>', on_event_double_click)
+    tree.bind('<KeyRelease-Return>', on_event_double_click)
     
     # Action buttons (fixed at bottom)
     btn_frame = ttk.Frame(viewer_window)
@@ -775,7 +894,7 @@ def show_enhanced_event_viewer(self, event_points):
     btn_frame.grid_columnconfigure(1, weight=1)  # Spacer column
     
     ttk.Button(btn_frame, text="🔄 Ereignisse neu laden", 
-                command=lambda: self.refresh_event_points(viewer_window)).grid(row=0, column=0, sticky="w", padx=(0, 10))
+                command=self.refresh_event_points).grid(row=0, column=0, sticky="w", padx=(0, 10))
     
     ttk.Button(btn_frame, text="📊 Validierungshistorie", 
                 command=lambda: self.show_validation_history()).grid(row=0, column=2, sticky="e", padx=(10, 10))
@@ -783,39 +902,245 @@ def show_enhanced_event_viewer(self, event_points):
     ttk.Button(btn_frame, text="❌ Schließen", 
                 command=viewer_window.destroy).grid(row=0, column=3, sticky="e")
 
-def navigate_to_event(self, event):
-    """Navigate to specific event in video player"""
+@functools.lru_cache(maxsize=8)
+def _get_event_capture(video_path):
+    """Shared EventPointCapture per video (it only holds the storage paths)"""
+    return EventPointCapture(video_path)
+
+@functools.lru_cache(maxsize=8)
+def _get_validator(video_path):
+    """Shared PersistentValidationManager per video; callers reload the state they need"""
+    return PersistentValidationManager(video_path)
+
+def _get_container_lock(self):
+    """Lock serializing event navigation's use of the PyAV container, detector.cap and the frame cache
+    
+    Background processing reads detector.cap without it, so navigate_to_event
+    refuses to seek while processing runs. Created on the Tk thread before the
+    first seek is queued.
+    """
+    lock = getattr(self.detector, '_container_lock', None)
+    if lock is None:
+        lock = self.detector._container_lock = threading.Lock()
+    return lock
+
+def _get_av_container(self):
+    """Return a PyAV container for the current video, (re)opening it when the video changed"""
+    detector = self.detector
+    container = getattr(detector, 'av_container', None)
+    if container is None or getattr(detector, '_av_container_path', None) != self.video_path:
+        if container is not None:
+            container.close()
+        import av  # Only needed here; keeps PyAV's native libraries out of this module's import
+        container = av.open(self.video_path)
+        detector.av_container = container
+        detector._av_container_path = self.video_path
+    return container
+
+def _event_target_pts(stream, event):
+    """Presentation timestamp of an event's start in the stream's time base"""
+    target_pts = int(event['start_time'] / stream.time_base)
+    if stream.start_time is not None:
+        target_pts += stream.start_time
+    return target_pts
+
+def _seek_keyframe(self, event):
+    """Preview: returns the BGR image of the keyframe at or before the event start
+    
+    Decodes only that keyframe from the PyAV container and leaves detector.cap
+    alone; it is positioned by the exact seek. Returns None without PyAV.
+    """
+    if not (PYAV_AVAILABLE and getattr(self, 'video_path', None)):
+        return None
     try:
-        if hasattr(self, 'detector') and hasattr(self.detector, 'cap'):
-            # Navigate to event start frame
-            start_frame = event['start_frame']
-            self.detector.cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
-            
-            # Update current frame display if possible
-            if hasattr(self.detector, 'current_frame'):
-                self.detector.current_frame = start_frame
-            
-            messagebox.showinfo("Navigation", 
-                                f"Zu Ereignis {event['index'] + 1} navigiert\n"
-                                f"Start: {event['start_time']:.2f}s\n"
-                                f"Dauer: {event['duration']:.2f}s")
+        with _get_container_lock(self):
+            container = _get_av_container(self)
+            stream = container.streams.video[0]
+            container.seek(_event_target_pts(stream, event), any_frame=False,
+                           backward=True, stream=stream)
+            for frame in container.decode(stream):
+                # to_ndarray copies out of PyAV's reused frame buffer
+                return frame.to_ndarray(format='bgr24')
+    except Exception as e:
+        logger.warning("PyAV keyframe preview failed: %s", e)
+    return None
+
+def _cv2_seek(self, start_frame, retrieve=False):
+    """Position detector.cap at a frame; returns the decoded frame only when retrieve is True
+    
+    Short forward jumps are walked with grab(), which skips pixel conversion and
+    avoids the decoder flush of CAP_PROP_POS_FRAMES. Retrieving leaves the
+    capture one frame past start_frame; navigation puts it back with _settle_cap.
+    """
+    import cv2  # Only needed here; keeps OpenCV out of this module's import
+    with _get_container_lock(self):
+        cap = self.detector.cap
+        delta = start_frame - int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+        if delta == 0:
+            logger.debug("Seek to frame %d skipped, already positioned", start_frame)
+        elif 0 < delta <= _GRAB_SEEK_WINDOW:
+            logger.debug("Seek to frame %d by grabbing %d frames", start_frame, delta)
+            for _ in range(delta):
+                if not cap.grab():
+                    break
         else:
+            logger.debug("Seek to frame %d via CAP_PROP_POS_FRAMES", start_frame)
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+        
+        if not retrieve:
+            return None
+        if not cap.grab():
+            return None
+        ret, frame = cap.retrieve()
+        return frame if ret else None
+
+def clear_video_caches(self):
+    """Forget per-video cached state (decoded event frames, validators) when another video is loaded"""
+    cache = getattr(self, '_frame_cache', None)
+    detector = getattr(self, 'detector', None)
+    container = getattr(detector, 'av_container', None)
+    if cache is not None or container is not None:
+        # A queued seek may still be using these on the worker thread
+        with _get_container_lock(self):
+            if cache is not None:
+                cache.clear()
+            if container is not None:
+                # Release the previous video file
+                container.close()
+                detector.av_container = None
+    _get_event_capture.cache_clear()
+    _get_validator.cache_clear()
+
+def _decode_event_frame(self, event):
+    """Return the BGR image at an event's start, served from a small LRU cache when possible"""
+    cache = self._frame_cache
+    key = (self.video_path, event['start_frame'])
+    with _get_container_lock(self):
+        image = cache.get(key)
+        if image is not None:
+            # No seek on a hit; _settle_cap moves detector.cap once the frame is shown
+            cache.move_to_end(key)
+            return image
+    
+    image = _cv2_seek(self, int(event['start_frame']), retrieve=True)
+    if image is None:
+        return None
+    with _get_container_lock(self):
+        cache[key] = image
+        if len(cache) > _FRAME_CACHE_SIZE:
+            cache.popitem(last=False)
+    return image
+
+def navigate_to_event(self, event, exact=True):
+    """Navigate to specific event in video player
+    
+    The seek runs on a single background worker so the GUI stays responsive;
+    requests superseded by a newer one before they start are dropped.
+    exact=False only shows the preceding keyframe (used while browsing the
+    event list): it needs PyAV, leaves detector.cap untouched and does not
+    show a confirmation.
+    """
+    if not exact and not PYAV_AVAILABLE:
+        return  # No cheap preview without PyAV
+    if not (hasattr(self, 'detector') and hasattr(self.detector, 'cap')):
+        if exact:
             messagebox.showwarning("Video nicht geladen", 
                                     "Video ist nicht geladen. Bitte laden Sie das Video erneut.")
+        return
+    
+    # Processing reads detector.cap on its own thread; seeking it meanwhile would corrupt the run
+    background_processor = getattr(self, 'background_processor', None)
+    if (getattr(background_processor, 'processing', False)
+            or getattr(self.detector, 'processing', False)):
+        if exact:
+            messagebox.showwarning("Verarbeitung läuft", 
+                                    "Navigation ist während der Videoverarbeitung nicht möglich.")
+        return
+    
+    # Worker-shared state is created here on the Tk thread, never on the worker
+    _get_container_lock(self)
+    if getattr(self, '_frame_cache', None) is None:
+        self._frame_cache = OrderedDict()
+    
+    self._latest_seek_target = event
+    if exact:
+        self._latest_exact_target = event
+    if getattr(self, '_seek_executor', None) is None:
+        self._seek_executor = ThreadPoolExecutor(max_workers=1)
+    self._seek_executor.submit(_do_seek, self, event, exact)
+
+def _do_seek(self, event, exact):
+    """Worker side of navigate_to_event; hands the result back to the Tk thread"""
+    if event is not self._latest_seek_target:
+        return  # A newer navigation request is already queued
+    try:
+        if exact:
+            image = _decode_event_frame(self, event)
+        else:
+            image = _seek_keyframe(self, event)
     except Exception as e:
-        messagebox.showerror("Navigation-Fehler", f"Fehler beim Navigieren: {str(e)}")
+        error_msg = f"Fehler beim Navigieren: {str(e)}"
+        self.root.after(0, lambda: messagebox.showerror("Navigation-Fehler", error_msg))
+        return
+    self.root.after(0, lambda: _finish_navigation(self, event, exact, image))
+    if exact:
+        # Queued behind any newer requests, so it only runs once a burst has settled
+        self._seek_executor.submit(_settle_cap, self, event)
 
-def refresh_event_points(self, parent_window):
+def _settle_cap(self, event):
+    """Leave detector.cap on the event's start frame, as the plain CAP_PROP_POS_FRAMES seek did
+    
+    Decoding the event frame leaves the capture one frame past it. This runs
+    after the frame is shown and is skipped when a newer exact navigation
+    will position the capture itself.
+    """
+    if event is not self._latest_exact_target:
+        return
+    try:
+        _cv2_seek(self, int(event['start_frame']))
+    except Exception as e:
+        logger.warning("Could not reposition the capture after navigation: %s", e)
+
+def _finish_navigation(self, event, exact, image):
+    """Update the display after a completed seek (runs on the Tk thread)"""
+    # Update current frame display if possible (previews don't move detector.cap)
+    if exact and hasattr(self.detector, 'current_frame'):
+        self.detector.current_frame = event['start_frame']
+    if image is not None and hasattr(self, 'show_frame'):
+        self.show_frame(image)
+    
+    if exact and event is self._latest_seek_target:
+        messagebox.showinfo("Navigation", 
+                            f"Zu Ereignis {event['index'] + 1} navigiert\n"
+                            f"Start: {event['start_time']:.2f}s\n"
+                            f"Dauer: {event['duration']:.2f}s")
+
+def _repopulate_events_tree(self):
+    """Refill an open event viewer from self._events_list; returns False if none is open"""
+    tree = getattr(self, '_events_tree', None)
+    try:
+        if tree is None or not tree.winfo_exists():
+            return False
+    except tk.TclError:
+        return False
+    self._events_tree_repopulate()
+    return True
+
+def refresh_event_points(self):
     """Refresh event points from current analysis"""
     try:
         if hasattr(self.detector, 'events') and self.detector.events:
-            from validation.persistent_validator import EventPointCapture
-            event_capture = EventPointCapture(self.video_path)
+            event_capture = _get_event_capture(self.video_path)
             event_capture.capture_event_points(self.detector.events)
             
+            # Update the open viewer in place instead of rebuilding the window
+            event_points = event_capture.load_event_points()
+            events_list = getattr(self, '_events_list', None)
+            if events_list is not None and event_points:
+                events_list[:] = event_points.get('events', [])
+                _repopulate_events_tree(self)
+            
             messagebox.showinfo("Aktualisiert", "Ereignispunkte wurden aktualisiert.")
-            parent_window.destroy()
-            self.show_previous_events_enhanced()
         else:
             messagebox.showwarning("Keine Ereignisse", "Keine aktuellen Ereignisse zum Aktualisieren.")
     except Exception as e:
@@ -830,6 +1155,7 @@ def refresh_event_points(self, parent_window):
 
 
 
+
 def load_existing_analysis(self, analysis_info):
     """Load existing analysis results for further validation or review"""
     try:
@@ -839,9 +1165,9 @@ def load_existing_analysis(self, analysis_info):
         # Find and load the most recent CSV file
         csv_files = analysis_info['files'].get('csv', [])
         if csv_files:
-            # Use the most recent CSV file
-            csv_file = max(csv_files, key=lambda f: os.path.getmtime(
-                os.path.join(analysis_info['folder_path'], f)))
+            # Use the most recent CSV file (times recorded by check_existing_analysis)
+            mtimes = analysis_info.get('file_mtimes', {})
+            csv_file = max(csv_files, key=lambda name: mtimes.get(name, 0.0))
             csv_path = os.path.join(analysis_info['folder_path'], csv_file)
             
             # Load events from CSV
@@ -886,12 +1212,10 @@ def update_video_workflow_status(self, status="loaded"):
     """Update status display to show video workflow information"""
     if hasattr(self, 'video_path') and self.video_path:
         try:
-            from utils.result_organizer import get_video_name_from_path
             video_name = get_video_name_from_path(self.video_path)
             
-            # Add workflow info to status (now console only)
-            workflow_status = f"Workflow: {video_name} ({status})"
-            print(f"[STATUS] {workflow_status}")
+            # Add workflow info to status (now log only)
+            logger.info("Workflow: %s (%s)", video_name, status)
         except:
             pass  # Don't fail if workflow status update fails
 
@@ -902,8 +1226,8 @@ def update_video_workflow_status(self, status="loaded"):
 def show_validation_history(self):
     """Show validation history and progress"""
     try:
-        from validation.persistent_validator import PersistentValidationManager
-        validator = PersistentValidationManager(self.video_path)
+        validator = _get_validator(self.video_path)
+        validator.load_validation_state()  # Pick up decisions saved since the last use
         
         validator.get_validation_progress()
         
@@ -920,10 +1244,19 @@ def show_validation_history(self):
         scrollbar = ttk.Scrollbar(history_window, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Recompute the scroll region at most once per burst of geometry changes
+        pending_region = [None]
+        
+        def _update_scrollregion():
+            pending_region[0] = None
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        def _on_frame_configure(event):
+            if pending_region[0] is not None:
+                history_window.after_cancel(pending_region[0])
+            pending_region[0] = history_window.after(50, _update_scrollregion)
+        
+        scrollable_frame.bind("<Configure>", _on_frame_configure)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -934,4 +1267,4 @@ def show_validation_history(self):
         
         
     except Exception as e:
-        print(f"Error while displaying validation history: {e}")
+        logger.error("Error while displaying validation history: %s", e)
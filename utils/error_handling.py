@@ -6,19 +6,85 @@ for robust production-ready operation.
 """
 
 import logging
+import logging.handlers
 import sys
 import os
+import queue
 import traceback
 import time
-from datetime import datetime
+import atexit
+import functools
+from collections import Counter, deque
 from pathlib import Path
 import threading
 from typing import Optional, Dict, Any, Callable
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+
+# File log buffering: records are written in large chunks and flushed on
+# ERROR/CRITICAL or at least every _LOG_FLUSH_INTERVAL seconds
+_LOG_BUFFER_SIZE = 128 * 1024
+_LOG_FLUSH_INTERVAL = 30.0
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that buffers writes and only flushes on errors or on demand"""
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=_LOG_BUFFER_SIZE,
+                    encoding=self.encoding)
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# Per-thread cache of the current thread's name
+_TLS = threading.local()
+
+
+def _current_thread_name() -> str:
+    """Return the current thread's name, cached per thread"""
+    try:
+        return _TLS.name
+    except AttributeError:
+        _TLS.name = threading.current_thread().name
+        return _TLS.name
+
+
+class _LazyTraceback:
+    """Frame-free traceback capture, formatted only when converted to a string"""
+
+    __slots__ = ('exc_type', 'exc_text', 'stack')
+
+    def __init__(self, exception: BaseException):
+        self.exc_type = type(exception).__name__
+        self.exc_text = str(exception)
+        # FrameSummary entries keep file/line/name only, not the frames and their locals
+        self.stack = traceback.extract_tb(exception.__traceback__)
+
+    def __str__(self):
+        return ('Traceback (most recent call last):\n' + ''.join(self.stack.format())
+                + f'{self.exc_type}: {self.exc_text}\n')
+
 
 class BatDetectionLogger:
     """Professional logging system for bat detection application"""
     
+    _LOG_PATH = None  # Daily log file, resolved once per process
+    
     def __init__(self, log_dir: str = "logs"):
         """Initialize logging system with file and console handlers"""
         self.log_dir = Path(log_dir)
@@ -27,22 +93,27 @@ class BatDetectionLogger:
         # Create logger
         self.logger = logging.getLogger("BatDetection")
         self.logger.setLevel(logging.DEBUG)
+        self._listener = None
+        self._file_handler = None
+        self._flush_timer = None
         
         # Prevent duplicate handlers
         if not self.logger.handlers:
             self._setup_handlers()
         
-        # Error tracking
-        self.error_count = 0
-        self.warning_count = 0
+        # Error tracking (counters are shared with PerformanceMonitor)
+        self.counters = Counter()
         self.last_error_time = None
-        self.error_history = []
+        self.error_history = deque(maxlen=50)  # Keep only last 50 errors
         
     def _setup_handlers(self):
-        """Setup file and console logging handlers"""
-        # File handler with rotation
-        log_file = self.log_dir / f"bat_detection_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        """Setup file and console logging handlers behind a background queue listener"""
+        # Buffered file handler
+        cls = type(self)
+        if cls._LOG_PATH is None or cls._LOG_PATH.parent != self.log_dir:
+            cls._LOG_PATH = self.log_dir / f"bat_detection_{time.strftime('%Y%m%d')}.log"
+        log_file = cls._LOG_PATH
+        file_handler = _BufferedFileHandler(log_file, encoding='utf-8', delay=True)
         file_handler.setLevel(logging.DEBUG)
         
         # Console handler
@@ -60,8 +131,51 @@ class BatDetectionLogger:
         file_handler.setFormatter(detailed_formatter)
         console_handler.setFormatter(simple_formatter)
         
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Producers only enqueue records; the listener thread does the I/O
+        log_queue = queue.Queue(-1)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        self._file_handler = file_handler
+        self._schedule_flush()
+        atexit.register(self.close)
+        
+    def _schedule_flush(self):
+        """Arm the periodic flush timer for the buffered file handler"""
+        self._flush_timer = threading.Timer(_LOG_FLUSH_INTERVAL, self._periodic_flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+        
+    def _periodic_flush(self):
+        """Flush buffered log records and re-arm the timer"""
+        if self._file_handler is None:
+            return
+        self._file_handler.flush()
+        self._schedule_flush()
+        
+    def close(self):
+        """Drain queued records, flush and close the log file"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._file_handler is not None:
+            self._file_handler.close()
+            self._file_handler = None
+        
+    @property
+    def error_count(self) -> int:
+        """Number of errors logged"""
+        return self.counters['error']
+        
+    @property
+    def warning_count(self) -> int:
+        """Number of warnings logged"""
+        return self.counters['warning']
         
     def info(self, message: str, **kwargs):
         """Log info message"""
@@ -69,31 +183,29 @@ class BatDetectionLogger:
         
     def warning(self, message: str, **kwargs):
         """Log warning message"""
-        self.warning_count += 1
+        self.counters['warning'] += 1
         self.logger.warning(message, **kwargs)
         
     def error(self, message: str, exception: Optional[Exception] = None, **kwargs):
         """Log error message with optional exception details"""
-        self.error_count += 1
+        self.counters['error'] += 1
         self.last_error_time = time.time()
         
         error_info = {
             'message': message,
             'timestamp': time.time(),
-            'thread': threading.current_thread().name
+            'thread': _current_thread_name()
         }
         
         if exception:
             error_info['exception'] = str(exception)
-            error_info['traceback'] = traceback.format_exc()
-            message = f"{message} | Exception: {str(exception)}"
+            error_info['exception_type'] = type(exception).__name__
+            error_info['traceback'] = _LazyTraceback(exception)
             
         self.error_history.append(error_info)
         
-        # Keep only last 50 errors
-        if len(self.error_history) > 50:
-            self.error_history = self.error_history[-50:]
-            
+        if exception:
+            message = f"{message} | Exception: {str(exception)}"
         self.logger.error(message, **kwargs)
         
     def critical(self, message: str, exception: Optional[Exception] = None, **kwargs):
@@ -115,6 +227,30 @@ class BatDetectionLogger:
         }
 
 
+# User-facing messages keyed by exception class
+_USER_MESSAGES = {
+    FileNotFoundError: 'Video file could not be found. Please check the file path.',
+    PermissionError: 'Permission denied. Please check file permissions.',
+    MemoryError: 'Insufficient memory. Try closing other applications.',
+    AttributeError: 'Internal component error. Please restart the application.',
+    ValueError: 'Invalid parameter detected. Please check your settings.',
+    ConnectionError: 'Network connection error during processing.',
+    TimeoutError: 'Operation timed out. The video may be too large.'
+}
+if cv2 is not None:
+    _USER_MESSAGES[cv2.error] = 'Video processing error. The video file may be corrupted.'
+
+
+@functools.lru_cache(maxsize=64)
+def _user_message(error_type: type, context: str) -> str:
+    """Resolve the user-facing message for an exception type and call-site context"""
+    return _USER_MESSAGES.get(error_type) or f"An unexpected error occurred during {context}"
+
+
+# Errors that require application shutdown
+_CRITICAL = (MemoryError, SystemError, KeyboardInterrupt, SystemExit)
+
+
 class ErrorHandler:
     """Professional error handling with user feedback and recovery strategies"""
     
@@ -122,6 +258,10 @@ class ErrorHandler:
         """Initialize error handler with logger and optional GUI callback"""
         self.logger = logger
         self.gui_callback = gui_callback
+        # Bound logging methods, resolved once
+        self._log_error = logger.error
+        self._log_info = logger.info
+        self._log_debug = logger.debug
         self.recovery_strategies = {}
         
     def register_recovery_strategy(self, error_type: str, strategy: Callable):
@@ -140,10 +280,10 @@ class ErrorHandler:
             bool: True if error was handled successfully, False if critical
         """
         error_type = type(error).__name__
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         
         # Log the error
-        self.logger.error(f"[{context}] {error_type}", exception=error)
+        self._log_error(f"[{context}] {error_type}", exception=error)
         
         # Prepare user-friendly message
         if user_message is None:
@@ -154,47 +294,28 @@ class ErrorHandler:
             try:
                 self.gui_callback(f"[{timestamp}] {user_message}")
             except Exception as gui_error:
-                self.logger.error("Failed to update GUI", exception=gui_error)
+                self._log_error("Failed to update GUI", exception=gui_error)
                 
         # Attempt recovery if strategy exists
         if recoverable and error_type in self.recovery_strategies:
             try:
                 recovery_result = self.recovery_strategies[error_type](error, context)
                 if recovery_result:
-                    self.logger.info(f"Successfully recovered from {error_type} in {context}")
+                    self._log_info(f"Successfully recovered from {error_type} in {context}")
                     return True
             except Exception as recovery_error:
-                self.logger.error(f"Recovery strategy failed for {error_type}", 
+                self._log_error(f"Recovery strategy failed for {error_type}", 
                                 exception=recovery_error)
                 
         return not self._is_critical_error(error)
         
     def _generate_user_message(self, error: Exception, context: str) -> str:
         """Generate user-friendly error message"""
-        error_type = type(error).__name__
-        
-        messages = {
-            'FileNotFoundError': 'Video file could not be found. Please check the file path.',
-            'PermissionError': 'Permission denied. Please check file permissions.',
-            'MemoryError': 'Insufficient memory. Try closing other applications.',
-            'cv2.error': 'Video processing error. The video file may be corrupted.',
-            'AttributeError': 'Internal component error. Please restart the application.',
-            'ValueError': 'Invalid parameter detected. Please check your settings.',
-            'ConnectionError': 'Network connection error during processing.',
-            'TimeoutError': 'Operation timed out. The video may be too large.'
-        }
-        
-        return messages.get(error_type, f"An unexpected error occurred during {context}")
+        return _user_message(type(error), context)
         
     def _is_critical_error(self, error: Exception) -> bool:
         """Determine if error is critical and requires application shutdown"""
-        critical_errors = [
-            MemoryError,
-            SystemError,
-            KeyboardInterrupt,
-            SystemExit
-        ]
-        return type(error) in critical_errors
+        return isinstance(error, _CRITICAL)
         
     def safe_execute(self, 
                     func: Callable, 
@@ -219,19 +340,62 @@ class ErrorHandler:
             if not suppress_errors:
                 self.handle_error(e, context, recoverable=True)
             else:
-                self.logger.debug(f"Suppressed error in {context}: {e}")
+                self._log_debug(f"Suppressed error in {context}: {e}")
             return fallback_result
 
+    def safe_method(self,
+                    context: str,
+                    fallback_result=None,
+                    suppress_errors: bool = False) -> Callable:
+        """
+        Decorator variant of safe_execute for frequently called helpers
+        
+        The error handling branch is chosen once at decoration time, so each
+        call only pays for the wrapped function and a try block:
+        
+            @error_handler.safe_method("frame processing", fallback_result=[])
+            def detect_in_frame(frame): ...
+        
+        Args:
+            context: Context description for logging
+            fallback_result: Value to return if the function fails
+            suppress_errors: If True, don't show user messages for errors
+        """
+        if suppress_errors:
+            log_debug = self._log_debug
+            
+            def on_error(e):
+                log_debug(f"Suppressed error in {context}: {e}")
+        else:
+            handle_error = self.handle_error
+            
+            def on_error(e):
+                handle_error(e, context, recoverable=True)
+                
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    on_error(e)
+                    return fallback_result
+            return wrapper
+        return decorator
+
 
 # Global logger instance
 _logger = None
+_LOGGER_LOCK = threading.Lock()
 
 def get_logger() -> BatDetectionLogger:
     """Get or create global logger instance"""
     global _logger
     if _logger is None:
-        _logger = BatDetectionLogger()
-        _logger.info("Bat Detection Application Logger Initialized")
+        with _LOGGER_LOCK:
+            if _logger is None:
+                _logger = BatDetectionLogger()
+                _logger.info("Bat Detection Application Logger Initialized")
     return _logger
 
 
@@ -266,35 +430,46 @@ class PerformanceMonitor:
     def __init__(self, logger: BatDetectionLogger):
         self.logger = logger
         self.metrics = {
-            'frame_processing_times': [],
+            'frame_processing_times': deque(maxlen=1000),  # Keep only last 1000 measurements
             'memory_usage': [],
             'cpu_usage': [],
-            'start_time': time.time(),
-            'frames_processed': 0,
-            'errors_encountered': 0
+            'start_time': time.monotonic(),
+            'frames_processed': 0
         }
+        # Running aggregates over the frame time window
+        self._time_sum = 0.0
+        self._time_max = 0.0
+        self._max_stale = False
         
     def record_frame_time(self, processing_time: float):
         """Record frame processing time"""
-        self.metrics['frame_processing_times'].append(processing_time)
+        frame_times = self.metrics['frame_processing_times']
+        if len(frame_times) == frame_times.maxlen:
+            evicted = frame_times[0]
+            self._time_sum -= evicted
+            if evicted >= self._time_max:
+                self._max_stale = True
+        frame_times.append(processing_time)
+        self._time_sum += processing_time
+        if processing_time > self._time_max:
+            self._time_max = processing_time
         self.metrics['frames_processed'] += 1
-        
-        # Keep only last 1000 measurements
-        if len(self.metrics['frame_processing_times']) > 1000:
-            self.metrics['frame_processing_times'] = self.metrics['frame_processing_times'][-1000:]
             
     def record_error(self):
-        """Record an error occurrence"""
-        self.metrics['errors_encountered'] += 1
+        """Kept for compatibility; errors are counted by the logger itself"""
         
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get performance summary"""
         frame_times = self.metrics['frame_processing_times']
-        total_time = time.time() - self.metrics['start_time']
+        total_time = time.monotonic() - self.metrics['start_time']
+        errors = self.logger.counters['error']
         
         if frame_times:
-            avg_frame_time = sum(frame_times) / len(frame_times)
-            max_frame_time = max(frame_times)
+            if self._max_stale:
+                self._time_max = max(frame_times)
+                self._max_stale = False
+            avg_frame_time = self._time_sum / len(frame_times)
+            max_frame_time = self._time_max
             fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
         else:
             avg_frame_time = 0
@@ -307,8 +482,8 @@ class PerformanceMonitor:
             'average_frame_time': avg_frame_time,
             'max_frame_time': max_frame_time,
             'effective_fps': fps,
-            'errors_encountered': self.metrics['errors_encountered'],
-            'error_rate': self.metrics['errors_encountered'] / max(1, self.metrics['frames_processed'])
+            'errors_encountered': errors,
+            'error_rate': errors / max(1, self.metrics['frames_processed'])
         }
         
     def log_performance_summary(self):
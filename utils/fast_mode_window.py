@@ -5,7 +5,6 @@ Creates a compact window for fast video processing without frame display
 
 import tkinter as tk
 from tkinter import ttk
-import threading
 import time
 
 class FastModeProgressWindow:
@@ -17,18 +16,27 @@ class FastModeProgressWindow:
     - Cancel button
     """
     
+    _REFRESH_MS = 100  # GUI refresh interval; progress samples in between are coalesced
+    _TIME_FMT = "Zeit: {:02d}:{:02d}"
+    _TIME_ETA_FMT = "Zeit: {:02d}:{:02d} (ETA: {:02d}:{:02d})"
+    _FPS_ALPHA = 0.1  # Smoothing factor for the ETA processing rate
+    
     def __init__(self, parent, total_frames, video_name="Video"):
         self.parent = parent
         self.total_frames = total_frames
         self.video_name = video_name
         self.window = None
         self.cancelled = False
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         
         # Progress tracking
         self.current_frame = 0
         self.detection_count = 0
-        self.last_update_time = time.time()
+        
+        # Smoothed processing rate for the ETA
+        self._fps_ewma = 0.0
+        self._last_frame = 0
+        self._last_t = self.start_time
         
         # UI elements
         self.progress_var = tk.DoubleVar()
@@ -99,38 +107,24 @@ class FastModeProgressWindow:
         # Handle window closing
         self.window.protocol("WM_DELETE_WINDOW", self.cancel_processing)
         
-        # Start update thread
-        self.update_thread = threading.Thread(target=self.update_display, daemon=True)
-        self.update_thread.start()
+        # Start the periodic display refresh on the Tk event loop
+        self._tick_id = self.window.after(self._REFRESH_MS, self._tick)
         
     def update_progress(self, frame_number, detections_in_frame=0):
         """Update progress from video processing thread"""
-        if self.cancelled:
-            return False
-            
+        # Plain attribute stores; _tick picks them up on the GUI thread
         self.current_frame = frame_number
         self.detection_count += detections_in_frame
-        
-        # Throttle updates to avoid GUI lag
-        current_time = time.time()
-        if current_time - self.last_update_time > 0.1:  # Update every 100ms max
-            self.last_update_time = current_time
-            
-            # Calculate progress percentage
-            progress_percent = (frame_number / self.total_frames) * 100 if self.total_frames > 0 else 0
-            
-            # Thread-safe GUI updates
-            if self.window and self.window.winfo_exists():
-                self.window.after_idle(self._update_gui, progress_percent, frame_number)
-        
         return not self.cancelled
         
-    def _update_gui(self, progress_percent, frame_number):
-        """Update GUI elements (called from main thread)"""
+    def _tick(self):
+        """Refresh progress, detections and time display from the latest sample (main thread)"""
+        if self.cancelled:
+            return
         try:
-            if not self.window or not self.window.winfo_exists():
-                return
-                
+            frame_number = self.current_frame
+            progress_percent = (frame_number / self.total_frames) * 100 if self.total_frames > 0 else 0
+            
             # Update progress bar
             self.progress_var.set(progress_percent)
             
@@ -142,55 +136,36 @@ class FastModeProgressWindow:
             self.detection_label_var.set(f"Erkennungen: {self.detection_count:,}")
             
             # Update processing time
-            elapsed = time.time() - self.start_time
-            minutes, seconds = divmod(int(elapsed), 60)
-            self.time_label_var.set(f"Zeit: {minutes:02d}:{seconds:02d}")
+            now = time.monotonic()
+            minutes, seconds = divmod(int(now - self.start_time), 60)
+            time_text = None
+            
+            # Update the smoothed processing rate
+            dt = now - self._last_t
+            if dt > 0.1:
+                rate = (frame_number - self._last_frame) / dt
+                if self._fps_ewma:
+                    self._fps_ewma += self._FPS_ALPHA * (rate - self._fps_ewma)
+                else:
+                    self._fps_ewma = rate
+                self._last_frame = frame_number
+                self._last_t = now
             
-            # Estimate remaining time
+            # Add ETA if available
             if frame_number > 0:
-                frames_per_second = frame_number / elapsed
                 remaining_frames = self.total_frames - frame_number
-                if frames_per_second > 0:
-                    eta_seconds = remaining_frames / frames_per_second
-                    eta_minutes, eta_seconds = divmod(int(eta_seconds), 60)
-                    if eta_minutes > 0:
-                        eta_text = f" (ETA: {eta_minutes:02d}:{eta_seconds:02d})"
-                        current_time = self.time_label_var.get()
-                        if "ETA" not in current_time:
-                            self.time_label_var.set(current_time + eta_text)
-                            
-        except Exception as e:
+                if self._fps_ewma > 0:
+                    eta_minutes, eta_seconds = divmod(int(remaining_frames / self._fps_ewma), 60)
+                    if eta_minutes > 0 or eta_seconds > 0:
+                        time_text = self._TIME_ETA_FMT.format(minutes, seconds, eta_minutes, eta_seconds)
+            
+            self.time_label_var.set(time_text or self._TIME_FMT.format(minutes, seconds))
+            self._tick_id = self.window.after(self._REFRESH_MS, self._tick)
+            
+        except Exception:
             # Ignore GUI update errors during shutdown
             pass
     
-    def update_display(self):
-        """Background thread for smooth GUI updates"""
-        while not self.cancelled and self.window and self.window.winfo_exists():
-            try:
-                # Update display every 200ms
-                time.sleep(0.2)
-                
-                # Update time display
-                if self.window and self.window.winfo_exists():
-                    elapsed = time.time() - self.start_time
-                    minutes, seconds = divmod(int(elapsed), 60)
-                    time_text = f"Zeit: {minutes:02d}:{seconds:02d}"
-                    
-                    # Add ETA if available
-                    if self.current_frame > 0:
-                        frames_per_second = self.current_frame / elapsed
-                        remaining_frames = self.total_frames - self.current_frame
-                        if frames_per_second > 0:
-                            eta_seconds = remaining_frames / frames_per_second
-                            eta_minutes, eta_seconds = divmod(int(eta_seconds), 60)
-                            if eta_minutes > 0 or eta_seconds > 0:
-                                time_text += f" (ETA: {eta_minutes:02d}:{eta_seconds:02d})"
-                    
-                    self.window.after_idle(lambda: self.time_label_var.set(time_text))
-                    
-            except Exception:
-                break
-    
     def cancel_processing(self):
         """Cancel the processing"""
         self.cancelled = True
@@ -214,6 +189,9 @@ class FastModeProgressWindow:
         """Show completion message and close window"""
         if not self.cancelled and self.window and self.window.winfo_exists():
             try:
+                # Stop periodic refresh so it doesn't overwrite the final stats
+                self.window.after_cancel(self._tick_id)
+                
                 # Update final stats
                 self.progress_var.set(100)
                 self.progress_label_var.set("Verarbeitung abgeschlossen!")
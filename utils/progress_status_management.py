@@ -1,8 +1,68 @@
+import functools
+import re
+import time
 import tkinter as tk
 from tkinter import messagebox, ttk
 
+from background_video_processor import ProgressDialog
+
 # Fix matplotlib font issues on Windows
 
+# GUI/Video status messages to HIDE
+_GUI_STATUS_PATTERNS = (
+    # Video loading/file operations
+    'loaded:', 'geladen:', 'video not loaded', 'failed to read video',
+    'stereo videos loaded', 'stereo calibration loaded',
+    
+    # Mode activation messages
+    'modus aktiviert', 'detection mode set to', 'aktiviert -',
+    
+    # Processing start/control messages
+    'erkennung gestartet', 'detection already running', 'video gestartet',
+    'stop gedrückt', 'processing', 'geöffnet',
+    
+    # Technical optimization messages
+    'opencv optimized', 'optimization warning', 'threads, optimizations enabled',
+    'background subtractor optimization',
+    
+    # Frame processing performance
+    'fps (threading optimized)', 'frame ',
+    
+    # Loading/opening operations
+    'öffne ', 'gui geöffnet', 'erstelle ',
+    
+    # Error messages for file operations (keep detection errors)
+    'error loading', 'failed to read', 'calibration not loaded',
+    'videos not loaded'
+)
+
+# Detection/Analysis messages to KEEP
+_DETECTION_PATTERNS = (
+    # Core detection events
+    'bat entered', 'bat exited', 'polygon', 'inside', 'outside',
+    
+    # Analysis results
+    'events detected', 'ereignisse gefunden', 'detection finished',
+    'analyse abgeschlossen', 'detection completed', 'detection error',
+    
+    # Validation and results
+    'validated', 'validierung', 'analyse', 'ereignisse',
+    
+    # Export completion (not start)
+    'export completed', 'export finished', 'erstellt:'
+)
+
+# Both pattern tables as single case-insensitive alternations
+_HIDE_RE = re.compile("|".join(map(re.escape, _GUI_STATUS_PATTERNS)), re.IGNORECASE)
+_SHOW_RE = re.compile("|".join(map(re.escape, _DETECTION_PATTERNS)), re.IGNORECASE)
+
+# Messages shorter than this can't match any pattern
+_MIN_PATTERN_LEN = min(map(len, _GUI_STATUS_PATTERNS + _DETECTION_PATTERNS))
+
+# Warning/error keywords in status messages
+_WARNING_RE = re.compile(r'warning|error|failed|fehler', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=1024)
 def _is_gui_status_message(message):
     """
     Determine if a status message is a GUI/video status that should be filtered out.
@@ -13,86 +73,45 @@ def _is_gui_status_message(message):
     if not message:
         return False
     
-    # Convert to lowercase for case-insensitive checking
-    msg_lower = message.lower()
-    
-    # GUI/Video status messages to HIDE
-    gui_status_patterns = [
-        # Video loading/file operations
-        'loaded:', 'geladen:', 'video not loaded', 'failed to read video',
-        'stereo videos loaded', 'stereo calibration loaded',
-        
-        # Mode activation messages
-        'modus aktiviert', 'detection mode set to', 'aktiviert -',
-        
-        # Processing start/control messages
-        'erkennung gestartet', 'detection already running', 'video gestartet',
-        'stop gedrückt', 'processing', 'geöffnet',
-        
-        # Technical optimization messages
-        'opencv optimized', 'optimization warning', 'threads, optimizations enabled',
-        'background subtractor optimization',
-        
-        # Frame processing performance
-        'fps (threading optimized)', 'frame ',
-        
-        # Loading/opening operations
-        'öffne ', 'gui geöffnet', 'erstelle ',
-        
-        # Error messages for file operations (keep detection errors)
-        'error loading', 'failed to read', 'calibration not loaded',
-        'videos not loaded'
-    ]
+    # Too short for any pattern: ambiguous, hidden by default
+    if len(message) < _MIN_PATTERN_LEN:
+        return True
     
     # Check if message contains any GUI status patterns
-    for pattern in gui_status_patterns:
-        if pattern in msg_lower:
-            return True
-    
-    # Detection/Analysis messages to KEEP (return False = show these)
-    detection_patterns = [
-        # Core detection events
-        'bat entered', 'bat exited', 'polygon', 'inside', 'outside',
-        
-        # Analysis results
-        'events detected', 'ereignisse gefunden', 'detection finished',
-        'analyse abgeschlossen', 'detection completed', 'detection error',
-        
-        # Validation and results
-        'validated', 'validierung', 'analyse', 'ereignisse',
-        
-        # Export completion (not start)
-        'export completed', 'export finished', 'erstellt:'
-    ]
-    
-    # If it's a detection message, always show it
-    for pattern in detection_patterns:
-        if pattern in msg_lower:
-            return False
+    if _HIDE_RE.search(message):
+        return True
     
+    # If it's a detection message, always show it.
     # For ambiguous messages, default to hiding GUI-style messages
-    # Show only if it's clearly important (contains detection keywords)
-    return True
+    return _SHOW_RE.search(message) is None
+
+# Minimum interval between Tk idle flushes from status/progress updates (~30 Hz)
+_IDLE_FLUSH_INTERVAL = 0.033
+
+def _flush_idle_tasks(self):
+    """Run root.update_idletasks(), at most once per _IDLE_FLUSH_INTERVAL"""
+    now = time.monotonic()
+    if now - getattr(self, '_last_idle_flush', 0.0) > _IDLE_FLUSH_INTERVAL:
+        self._last_idle_flush = now
+        self.root.update_idletasks()
 
 def update_status(self, message):
     """Update status - overlay replaces console logging"""
     # 🎥 OVERLAY SYSTEM: Console [STATUS] logging disabled
     # Video overlay system now handles progress feedback
     # Warning/error handling managed internally - removed console output
-    if any(keyword in message.lower() for keyword in ['warning', 'error', 'failed', 'fehler']):
-        # Warning handled internally - removed console output
-        pass
     
     # GUI status section has been removed as requested
     # Keeping only console output for debugging purposes
     if hasattr(self, 'root'):
-        self.root.update_idletasks()
+        _flush_idle_tasks(self)
 
 
 def update_progress_bar(self, percentage):
         """Update progress bar if available"""
         if hasattr(self, 'current_progress_dialog') and self.current_progress_dialog:
             self.current_progress_dialog.update_progress(percentage)
+            _flush_idle_tasks(self)
   
   
   
@@ -112,7 +131,6 @@ def show_progress_dialog(self, title="Processing Video...", cancelable=True):
         if hasattr(self, 'current_progress_dialog') and self.current_progress_dialog:
             self.current_progress_dialog.close()
             
-        from background_video_processor import ProgressDialog
         self.current_progress_dialog = ProgressDialog(self.root, title, cancelable)
         
         # Connect the progress dialog to the background processor for direct cancellation
@@ -238,9 +256,6 @@ class status:
         # 🎥 OVERLAY SYSTEM: Console [STATUS] logging disabled
         # Video overlay system now handles progress feedback
         # Warning/error handling managed internally - removed console output
-        if any(keyword in msg.lower() for keyword in ['warning', 'error', 'failed', 'fehler']):
-            # Warning handled internally - removed console output
-            pass
         if hasattr(self, 'root'):
             self.root.update_idletasks()
 
@@ -249,7 +264,7 @@ class status:
         # 🎥 OVERLAY SYSTEM: Console [STATUS] logging disabled
         # Video overlay system now handles progress feedback
         # Only show warnings and errors in console
-        if any(keyword in msg.lower() for keyword in ['warning', 'error', 'failed', 'fehler']):
+        if _WARNING_RE.search(msg):
             print(f"[WARNING] {msg}")
         if hasattr(self, 'root'):
             self.root.update_idletasks()
@@ -259,8 +274,5 @@ class status:
         # 🎥 OVERLAY SYSTEM: Console [STATUS] logging disabled
         # Video overlay system now handles progress feedback
         # Warning/error handling managed internally - removed console output
-        if any(keyword in message.lower() for keyword in ['warning', 'error', 'failed', 'fehler']):
-            # Warning handled internally - removed console output
-            pass
         if hasattr(self, 'root'):
             self.root.update_idletasks() 
\ No newline at end of file
@@ -3,11 +3,18 @@ Result Organization Utilities
 Provides structured organization for analysis results based on video files
 """
 
+import functools
 import os
 import re
 from datetime import datetime
 
 
+# Folder name cleanup: disallowed characters and underscore runs
+_CLEAN_RE = re.compile(r'[^\w\-_]')
+_UNDERSCORE_RE = re.compile(r'_+')
+
+
+@functools.lru_cache(maxsize=256)
 def get_video_name_from_path(video_path):
     """
     Extract clean video name from path for folder naming
@@ -27,10 +34,10 @@ def get_video_name_from_path(video_path):
         
         # Clean filename for folder naming (remove special characters)
         # Allow letters, numbers, underscores, hyphens
-        clean_name = re.sub(r'[^\w\-_]', '_', filename)
+        clean_name = _CLEAN_RE.sub('_', filename)
         
         # Remove multiple consecutive underscores
-        clean_name = re.sub(r'_+', '_', clean_name)
+        clean_name = _UNDERSCORE_RE.sub('_', clean_name)
         
         # Remove leading/trailing underscores
         clean_name = clean_name.strip('_')
@@ -105,14 +112,30 @@ def get_unique_video_folder(base_dir, video_name):
         return folder_path
     
     # If folder exists, try numbered versions
-    counter = 1
-    while True:
-        numbered_name = f"{video_name}_{counter}"
-        folder_path = os.path.join(base_dir, numbered_name)
+    return _next_numbered_folder(base_dir, video_name)
+
+
+def _next_numbered_folder(base_dir, video_name):
+    """
+    Find the first free "<video_name>_<n>" folder path in base_dir
+    
+    Reads the directory once instead of probing each candidate with a stat call.
+    
+    Args:
+        base_dir (str): Base results directory
+        video_name (str): Clean video name
         
-        if not os.path.exists(folder_path):
-            return folder_path
-            
+    Returns:
+        str: Free numbered folder path
+    """
+    try:
+        with os.scandir(base_dir) as it:
+            existing = {os.path.normcase(entry.name) for entry in it}
+    except FileNotFoundError:
+        existing = set()
+    
+    counter = 1
+    while os.path.normcase(f"{video_name}_{counter}") in existing:
         counter += 1
         
         # Safety check to prevent infinite loop
@@ -120,6 +143,8 @@ def get_unique_video_folder(base_dir, video_name):
             # Use timestamp as last resort
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             return os.path.join(base_dir, f"{video_name}_{timestamp}")
+    
+    return os.path.join(base_dir, f"{video_name}_{counter}")
 
 
 def get_video_folder_with_user_choice(base_dir, video_name, user_choice=None):
@@ -145,20 +170,7 @@ def get_video_folder_with_user_choice(base_dir, video_name, user_choice=None):
         return primary_folder, "reuse"
     elif user_choice == "new_version":
         # Create numbered version
-        counter = 1
-        while True:
-            numbered_name = f"{video_name}_{counter}"
-            folder_path = os.path.join(base_dir, numbered_name)
-            
-            if not os.path.exists(folder_path):
-                return folder_path, "new_version"
-                
-            counter += 1
-            
-            # Safety check
-            if counter > 9999:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                return os.path.join(base_dir, f"{video_name}_{timestamp}"), "new_version"
+        return _next_numbered_folder(base_dir, video_name), "new_version"
     elif user_choice == "cancel":
         return None
     else:
@@ -167,6 +179,17 @@ def get_video_folder_with_user_choice(base_dir, video_name, user_choice=None):
         return primary_folder, "reuse"
 
 
+# File suffix -> analyze_existing_folder bucket (all suffixes are 4 characters)
+_SUFFIX_BUCKETS = {
+    '.csv': 'csv',
+    '.pdf': 'pdf',
+    '.avi': 'videos',
+    '.mp4': 'videos',
+    '.png': 'images',
+    '.jpg': 'images'
+}
+
+
 def analyze_existing_folder(folder_path):
     """
     Analyze what files exist in a folder to help user make decisions
@@ -181,7 +204,8 @@ def analyze_existing_folder(folder_path):
         return {"exists": False, "files": [], "analysis_count": 0}
     
     try:
-        files = os.listdir(folder_path)
+        with os.scandir(folder_path) as it:
+            entries = list(it)
         
         analysis_files = {
             "csv": [],
@@ -191,27 +215,16 @@ def analyze_existing_folder(folder_path):
             "other": []
         }
         
-        for file in files:
-            file_lower = file.lower()
-            if file_lower.endswith('.csv'):
-                analysis_files["csv"].append(file)
-            elif file_lower.endswith('.pdf'):
-                analysis_files["pdf"].append(file)
-            elif file_lower.endswith('.avi') or file_lower.endswith('.mp4'):
-                analysis_files["videos"].append(file)
-            elif file_lower.endswith('.png') or file_lower.endswith('.jpg'):
-                analysis_files["images"].append(file)
-            else:
-                analysis_files["other"].append(file)
+        for entry in entries:
+            file = entry.name
+            analysis_files[_SUFFIX_BUCKETS.get(file[-4:].lower(), "other")].append(file)
         
-        # Get latest modification time
+        # Get latest modification time (DirEntry.stat() reuses the scandir data where possible)
         latest_time = None
-        if files:
+        if entries:
             try:
-                latest_file = max(files, key=lambda f: os.path.getmtime(os.path.join(folder_path, f)))
-                latest_time = datetime.fromtimestamp(
-                    os.path.getmtime(os.path.join(folder_path, latest_file))
-                ).strftime("%d.%m.%Y %H:%M")
+                latest_mtime = max(entry.stat().st_mtime for entry in entries)
+                latest_time = datetime.fromtimestamp(latest_mtime).strftime("%d.%m.%Y %H:%M")
             except:
                 latest_time = "Unbekannt"
         
@@ -220,7 +233,7 @@ def analyze_existing_folder(folder_path):
         return {
             "exists": True,
             "files": analysis_files,
-            "total_files": len(files),
+            "total_files": len(entries),
             "analysis_count": total_analysis_files,
             "latest_modification": latest_time,
             "folder_path": folder_path
@@ -230,6 +243,17 @@ def analyze_existing_folder(folder_path):
         return {"exists": True, "error": str(e), "files": [], "analysis_count": 0}
 
 
+# Standardized output filenames per file type
+_STANDARD_FILENAMES = {
+    'report': 'report.pdf',
+    'report_text': 'report.txt',
+    'detections': 'detections.csv',
+    'flugweg': 'flugweg.png',
+    'marked_video': 'marked_video.mp4',
+    'flight_paths': 'flight_paths.png'
+}
+
+
 def get_standardized_filename(file_type, video_folder_name):
     """
     Get standardized filename for different output types
@@ -241,16 +265,7 @@ def get_standardized_filename(file_type, video_folder_name):
     Returns:
         str: Standardized filename
     """
-    filename_map = {
-        'report': 'report.pdf',
-        'report_text': 'report.txt', 
-        'detections': 'detections.csv',
-        'flugweg': 'flugweg.png',
-        'marked_video': 'marked_video.mp4',
-        'flight_paths': 'flight_paths.png'
-    }
-    
-    return filename_map.get(file_type, f"{file_type}.txt")
+    return _STANDARD_FILENAMES.get(file_type) or f"{file_type}.txt"
 
 
 def get_analysis_session_info(video_path):
@@ -285,31 +300,34 @@ def create_result_summary(structure, session_info, results_created):
     """
     summary_path = os.path.join(structure["base"], "analysis_summary.txt")
     
+    lines = [
+        "=" * 60 + "\n",
+        "FLEDERMAUS-ANALYSE ZUSAMMENFASSUNG\n",
+        "=" * 60 + "\n\n",
+        f"Video-Datei: {os.path.basename(session_info['video_path']) if session_info['video_path'] else 'Unbekannt'}\n",
+        f"Ordner-Name: {structure['video_name']}\n",
+        f"Analysiert am: {session_info['timestamp'].strftime('%d.%m.%Y um %H:%M:%S')}\n",
+    ]
+    if session_info['video_path']:
+        lines.append(f"Video-Pfad: {session_info['video_path']}\n")
+    lines.append("\n")
+    
+    lines.append("ERSTELLE DATEIEN:\n")
+    lines.append("-" * 30 + "\n")
+    
+    for file_path in results_created:
+        try:
+            file_size = os.stat(file_path).st_size
+        except (OSError, TypeError, ValueError):
+            filename = os.path.basename(file_path) if file_path else "unbekannte Datei"
+            lines.append(f"✗ {filename} (nicht gefunden)\n")
+        else:
+            lines.append(f"✓ {os.path.basename(file_path)} ({file_size:,} bytes)\n")
+    
+    lines.append(f"\nInsgesamt {len(results_created)} Dateien erstellt.\n")
+    lines.append(f"Alle Ergebnisse gespeichert in: {structure['base']}\n")
+    
     with open(summary_path, 'w', encoding='utf-8') as f:
-        f.write("=" * 60 + "\n")
-        f.write("FLEDERMAUS-ANALYSE ZUSAMMENFASSUNG\n")
-        f.write("=" * 60 + "\n\n")
-        
-        f.write(f"Video-Datei: {os.path.basename(session_info['video_path']) if session_info['video_path'] else 'Unbekannt'}\n")
-        f.write(f"Ordner-Name: {structure['video_name']}\n")
-        f.write(f"Analysiert am: {session_info['timestamp'].strftime('%d.%m.%Y um %H:%M:%S')}\n")
-        if session_info['video_path']:
-            f.write(f"Video-Pfad: {session_info['video_path']}\n")
-        f.write("\n")
-        
-        f.write("ERSTELLE DATEIEN:\n")
-        f.write("-" * 30 + "\n")
-        
-        for file_path in results_created:
-            if os.path.exists(file_path):
-                filename = os.path.basename(file_path)
-                file_size = os.path.getsize(file_path)
-                f.write(f"✓ {filename} ({file_size:,} bytes)\n")
-            else:
-                filename = os.path.basename(file_path) if file_path else "unbekannte Datei"
-                f.write(f"✗ {filename} (nicht gefunden)\n")
-        
-        f.write(f"\nInsgesamt {len(results_created)} Dateien erstellt.\n")
-        f.write(f"Alle Ergebnisse gespeichert in: {structure['base']}\n")
+        f.write(''.join(lines))
     
     return summary_path
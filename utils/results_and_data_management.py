@@ -1,11 +1,15 @@
 import os
 import sys
+import threading
+import functools
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import cv2
 import csv
 from datetime import datetime
 
+from utils.tk_helpers import attach_scroll_paging, load_in_background, screen_size
+
 # Fix matplotlib font issues on Windows
 
 def format_time(seconds):
@@ -16,31 +20,44 @@ def format_time(seconds):
 
 
 
+def _event_value(event, key, legacy_key):
+    """Value of `key` in an event dict, falling back to its legacy German key"""
+    value = event.get(key)
+    return event.get(legacy_key) if value is None else value
+
 def update_event_display(self):
     """Update the event display in the treeview with safe entry/exit time handling"""
-    # Clear existing items
-    for item in self.tree.get_children():
-        self.tree.delete(item)
+    tree = self.tree
+    
+    # Clear existing items in one Tcl call
+    children = tree.get_children()
+    if children:
+        tree.delete(*children)
         
     # Add events to treeview
-    if hasattr(self.detector, 'events'):
-        for event in self.detector.events:
+    events = getattr(self.detector, 'events', None)
+    if events is not None:
+        # Module-level MM:SS formatter (format_time below), called without the app wrapper
+        fmt = format_time
+        value = _event_value
+        rows = []
+        for event in events:
             # Safe handling of entry time
-            entry_time = event.get('entry') or event.get('einflugzeit')
+            entry_time = value(event, 'entry', 'einflugzeit')
             if entry_time is None:
                 entry_time_str = "unbekannt"
             else:
-                entry_time_str = self.format_time(entry_time)
+                entry_time_str = fmt(self, entry_time)
             
             # Safe handling of exit time  
-            exit_time = event.get('exit') or event.get('ausflugzeit')
+            exit_time = value(event, 'exit', 'ausflugzeit')
             if exit_time is None:
                 exit_time_str = "unbekannt"
             else:
-                exit_time_str = self.format_time(exit_time)
+                exit_time_str = fmt(self, exit_time)
             
             # Safe handling of duration
-            duration = event.get('duration') or event.get('dauer')
+            duration = value(event, 'duration', 'dauer')
             if duration is None:
                 duration_str = "unbekannt"
             elif duration <= 0:
@@ -54,7 +71,18 @@ def update_event_display(self):
                 exit_time_str += " ⚠"
                 duration_str += " ⚠"
             
-            self.tree.insert('', 'end', values=(entry_time_str, exit_time_str, duration_str))
+            rows.append((entry_time_str, exit_time_str, duration_str))
+        
+        # Insert all formatted rows after the formatting pass
+        insert = tree.insert
+        for values in rows:
+            insert('', 'end', values=values)
+
+
+def _centered_geometry(self, width, height):
+    """Geometry string that centers a width x height window on the screen"""
+    screen_width, screen_height = screen_size(self)
+    return f"{width}x{height}+{(screen_width - width) // 2}+{(screen_height - height) // 2}"
 
 
 def show_results_access_panel(self, event=None):
@@ -72,23 +100,21 @@ def show_results_access_panel(self, event=None):
         
         # Get all video result folders
         video_folders = []
-        for item in os.listdir(results_dir):
-            folder_path = os.path.join(results_dir, item)
-            if os.path.isdir(folder_path) and not item.startswith('.'):
+        with os.scandir(results_dir) as it:
+            for entry in it:
+                if entry.name.startswith('.') or not entry.is_dir():
+                    continue
                 # Get the modification time for sorting
                 try:
-                    mod_time = os.path.getmtime(folder_path)
-                    video_folders.append((item, folder_path, mod_time))
+                    mod_time = entry.stat().st_mtime
+                    video_folders.append((entry.name, entry.path, mod_time))
                 except:
                     # Fallback if stat fails
-                    video_folders.append((item, folder_path, 0))
+                    video_folders.append((entry.name, entry.path, 0))
         
         # Sort by modification time (most recent first)
         video_folders.sort(key=lambda x: x[2], reverse=True)
         
-        # Remove the timestamp from tuples for compatibility
-        video_folders = [(item, folder_path) for item, folder_path, _ in video_folders]
-        
         if not video_folders:
             messagebox.showinfo("Keine Ergebnisse", 
                                 "Keine Videoergebnisse gefunden.\n"
@@ -116,14 +142,10 @@ def show_results_access_window(self, video_folders, results_dir):
     access_window.grid_columnconfigure(0, weight=1)
     
     # Center window on screen
-    access_window.update_idletasks()
-    screen_width = access_window.winfo_screenwidth()
-    screen_height = access_window.winfo_screenheight()
+    screen_width, screen_height = screen_size(self)
     window_width = min(1000, screen_width - 100)
     window_height = min(700, screen_height - 100)
-    x = (screen_width - window_width) // 2
-    y = (screen_height - window_height) // 2
-    access_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+    access_window.geometry(_centered_geometry(self, window_width, window_height))
     
     # Main container with grid layout for proper responsiveness
     main_container = ttk.Frame(access_window)
@@ -173,7 +195,17 @@ def show_results_access_window(self, video_folders, results_dir):
     canvas.bind("<Configure>", configure_canvas_width)
     
     canvas_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-    canvas.configure(yscrollcommand=scrollbar.set)
+    
+    # Folder cards are created a page at a time as the user scrolls towards the
+    # end of the list, so large result archives don't build every card up front
+    card_page_size = 20
+    
+    def _add_card(i, folder):
+        folder_name, folder_path, mod_time = folder
+        self.create_result_folder_card(scrollable_frame, folder_name, folder_path, i, access_window,
+                                       mod_time)
+    
+    add_cards, _ = attach_scroll_paging(canvas, scrollbar, video_folders, _add_card, card_page_size)
     
     # Grid layout for canvas and scrollbar
     canvas.grid(row=0, column=0, sticky="nsew")
@@ -206,9 +238,24 @@ def show_results_access_window(self, video_folders, results_dir):
     canvas.bind('<Enter>', _bind_mousewheel)
     canvas.bind('<Leave>', _unbind_mousewheel)
     
-    # Add video folders (sorted by most recent first)
-    for i, (folder_name, folder_path) in enumerate(video_folders):
-        self.create_result_folder_card(scrollable_frame, folder_name, folder_path, i, access_window)
+    # Add video folders (sorted by most recent first); further pages follow on scroll
+    add_cards()
+    
+    # Categorize the remaining folders in the background so later pages only
+    # hit the folder file cache instead of scanning on the Tk thread
+    window_closed = threading.Event()
+    
+    def _prefetch_folder_files():
+        for _, folder_path, _ in video_folders[card_page_size:]:
+            if window_closed.is_set():
+                break
+            self.analyze_folder_files(folder_path)
+    
+    if len(video_folders) > card_page_size:
+        access_window.bind("<Destroy>",
+                           lambda e: window_closed.set() if e.widget is access_window else None,
+                           add="+")
+        threading.Thread(target=_prefetch_folder_files, daemon=True).start()
     
     # Footer with statistics and actions - fixed at bottom
     footer_frame = ttk.Frame(main_container)
@@ -234,7 +281,12 @@ def show_results_access_window(self, video_folders, results_dir):
     ttk.Button(actions_frame, text="❌ Schließen", 
                 command=access_window.destroy).pack(side=tk.LEFT)
 
-def create_result_folder_card(self, parent, folder_name, folder_path, index, access_window):
+@functools.lru_cache(maxsize=4096)
+def _format_folder_mtime(mtime_seconds):
+    """Format a whole-second folder modification time for result cards"""
+    return datetime.fromtimestamp(mtime_seconds).strftime('%d.%m.%Y %H:%M')
+
+def create_result_folder_card(self, parent, folder_name, folder_path, index, access_window, mod_time=None):
     """Create a card for each video result folder with file access buttons"""
     # Card frame with alternating colors and better resizing behavior
     card_bg = '#f8f9fa' if index % 2 == 0 else '#ffffff'
@@ -259,9 +311,9 @@ def create_result_folder_card(self, parent, folder_name, folder_path, index, acc
     
     # Timestamp info with better formatting
     try:
-        folder_stat = os.stat(folder_path)
-        modified_time = datetime.fromtimestamp(folder_stat.st_mtime)
-        time_text = f"Zuletzt geändert: {modified_time.strftime('%d.%m.%Y %H:%M')}"
+        if not mod_time:
+            mod_time = os.stat(folder_path).st_mtime
+        time_text = f"Zuletzt geändert: {_format_folder_mtime(int(mod_time))}"
         # Add "NEUESTE" indicator for the first (most recent) entry
         if index == 0:
             time_text = "🆕 NEUESTE - " + time_text
@@ -272,6 +324,15 @@ def create_result_folder_card(self, parent, folder_name, folder_path, index, acc
             tk.Label(header_frame, text="🆕 NEUESTE", font=('Segoe UI', 9), 
                     bg=card_bg, fg='#7f8c8d').pack(side=tk.RIGHT)
     
+    # File buttons are built once the headers of this page have been drawn
+    content_frame.after_idle(_build_card_buttons, self, content_frame, card_bg,
+                             folder_name, folder_path, access_window)
+
+def _build_card_buttons(self, content_frame, card_bg, folder_name, folder_path, access_window):
+    """Add the file access buttons to a result folder card"""
+    if not content_frame.winfo_exists():
+        return  # Results window closed before the card was completed
+    
     # Analyze available files
     available_files = self.analyze_folder_files(folder_path)
     
@@ -340,8 +401,27 @@ def create_result_folder_card(self, parent, folder_name, folder_path, index, acc
         tk.Label(row2_frame, text=count_text, font=('Segoe UI', 9), 
                 bg=card_bg, fg='#7f8c8d').pack(side=tk.RIGHT)
 
+# File extension -> analyze_folder_files category
+_EXT_CATEGORIES = {
+    'pdf': 'pdf',
+    'csv': 'csv',
+    'avi': 'videos', 'mp4': 'videos', 'mov': 'videos',
+    'png': 'images', 'jpg': 'images', 'jpeg': 'images'
+}
+
 def analyze_folder_files(self, folder_path):
     """Analyze files in a result folder and categorize them"""
+    # Reuse the last categorization while the folder's entries are unchanged
+    if not hasattr(self, '_folder_files_cache'):
+        self._folder_files_cache = {}
+    try:
+        folder_mtime = os.stat(folder_path).st_mtime_ns
+    except OSError:
+        folder_mtime = None
+    cached = self._folder_files_cache.get(folder_path)
+    if cached is not None and folder_mtime is not None and cached[0] == folder_mtime:
+        return {category: list(paths) for category, paths in cached[1].items()}
+    
     files = {
         'pdf': [],
         'csv': [],
@@ -351,24 +431,19 @@ def analyze_folder_files(self, folder_path):
     }
     
     try:
-        for filename in os.listdir(folder_path):
-            file_path = os.path.join(folder_path, filename)
-            if os.path.isfile(file_path):
-                ext = filename.lower().split('.')[-1]
-                
-                if ext == 'pdf':
-                    files['pdf'].append(file_path)
-                elif ext == 'csv':
-                    files['csv'].append(file_path)
-                elif ext in ['avi', 'mp4', 'mov']:
-                    files['videos'].append(file_path)
-                elif ext in ['png', 'jpg', 'jpeg']:
-                    files['images'].append(file_path)
-                else:
-                    files['other'].append(file_path)
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                ext = entry.name.rpartition('.')[2].lower()
+                files[_EXT_CATEGORIES.get(ext, 'other')].append(entry.path)
     except Exception as e:
         # Error analyzing folder - handled internally
         pass
+    else:
+        if folder_mtime is not None:
+            self._folder_files_cache[folder_path] = (
+                folder_mtime, {category: list(paths) for category, paths in files.items()})
     
     return files
 
@@ -401,17 +476,11 @@ def open_csv_files_menu(self, csv_files, folder_name):
     # Multiple CSV files - show selection
     menu_window = tk.Toplevel(self.root)
     menu_window.title(f"CSV-Dateien - {folder_name}")
-    menu_window.geometry("500x300")
+    menu_window.geometry(_centered_geometry(self, 500, 300))
     menu_window.resizable(False, False)
     menu_window.transient(self.root)
     menu_window.grab_set()
     
-    # Center window
-    menu_window.update_idletasks()
-    x = (menu_window.winfo_screenwidth() - menu_window.winfo_width()) // 2
-    y = (menu_window.winfo_screenheight() - menu_window.winfo_height()) // 2
-    menu_window.geometry(f"+{x}+{y}")
-    
     main_frame = ttk.Frame(menu_window)
     main_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
     
@@ -434,105 +503,124 @@ def open_csv_files_menu(self, csv_files, folder_name):
     ttk.Button(main_frame, text="Schließen", 
                 command=menu_window.destroy).pack(pady=(15, 0))
 
-    def open_video_files_menu(self, video_files, folder_name):
-        """Show menu for selecting video file to open"""
-        if len(video_files) == 1:
-            self.open_file_with_system(video_files[0])
-            return
-        
-        # Multiple video files - show selection (similar to CSV menu)
-        self.show_file_selection_menu(video_files, folder_name, "🎥 Video-Dateien", "🎬")
-
-    def open_image_files_menu(self, image_files, folder_name):
-        """Show menu for selecting image file to open"""
-        if len(image_files) == 1:
-            self.open_file_with_system(image_files[0])
-            return
-        
-        # Multiple image files - show selection
-        self.show_file_selection_menu(image_files, folder_name, "🗺️ Bilder", "🖼️")
+def open_video_files_menu(self, video_files, folder_name):
+    """Show menu for selecting video file to open"""
+    if len(video_files) == 1:
+        self.open_file_with_system(video_files[0])
+        return
+    
+    # Multiple video files - show selection (similar to CSV menu)
+    self.show_file_selection_menu(video_files, folder_name, "🎥 Video-Dateien", "🎬")
 
-    def show_file_selection_menu(self, files, folder_name, title, icon):
-        """Generic file selection menu"""
-        menu_window = tk.Toplevel(self.root)
-        menu_window.title(f"{title} - {folder_name}")
-        menu_window.geometry("600x400")
-        menu_window.resizable(True, True)
-        menu_window.transient(self.root)
-        menu_window.grab_set()
-        
-        # Center window
-        menu_window.update_idletasks()
-        x = (menu_window.winfo_screenwidth() - menu_window.winfo_width()) // 2
-        y = (menu_window.winfo_screenheight() - menu_window.winfo_height()) // 2
-        menu_window.geometry(f"+{x}+{y}")
-        
-        main_frame = ttk.Frame(menu_window)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
-        
-        ttk.Label(main_frame, text=f"{title} auswählen", 
-                    font=('Segoe UI', 14, 'bold')).pack(pady=(0, 15))
-        
-        # Scrollable list
-        list_frame = ttk.Frame(main_frame)
-        list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
-        
-        listbox = tk.Listbox(list_frame, font=('Segoe UI', 10))
-        scrollbar_y = ttk.Scrollbar(list_frame, orient="vertical", command=listbox.yview)
-        scrollbar_x = ttk.Scrollbar(list_frame, orient="horizontal", command=listbox.xview)
-        
-        listbox.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
-        
-        for file_path in files:
-            filename = os.path.basename(file_path)
-            file_size = self.get_file_size_str(file_path)
-            listbox.insert(tk.END, f"{icon} {filename} ({file_size})")
-        
-        # Pack scrollbars and listbox
-        scrollbar_y.pack(side="right", fill="y")
-        scrollbar_x.pack(side="bottom", fill="x")
-        listbox.pack(side="left", fill="both", expand=True)
-        
-        # Double-click to open
-        def on_double_click(event):
-            selection = listbox.curselection()
-            if selection:
-                file_path = files[selection[0]]
-                self.open_file_with_system(file_path)
-                menu_window.destroy()
-        
-        listbox.bind("<Double-Button-1>", on_double_click)
-        
-        # Buttons
-        button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=tk.X)
-        
-        def open_selected():
-            selection = listbox.curselection()
-            if selection:
-                file_path = files[selection[0]]
-                self.open_file_with_system(file_path)
-                menu_window.destroy()
-            else:
-                messagebox.showwarning("Keine Auswahl", "Bitte wählen Sie eine Datei aus.")
-        
-        ttk.Button(button_frame, text="Öffnen", command=open_selected).pack(side=tk.LEFT)
-        ttk.Button(button_frame, text="Alle öffnen", 
-                    command=lambda: [self.open_file_with_system(f) for f in files]).pack(side=tk.LEFT, padx=(10, 0))
-        ttk.Button(button_frame, text="Schließen", 
-                    command=menu_window.destroy).pack(side=tk.RIGHT)
+def open_image_files_menu(self, image_files, folder_name):
+    """Show menu for selecting image file to open"""
+    if len(image_files) == 1:
+        self.open_file_with_system(image_files[0])
+        return
+    
+    # Multiple image files - show selection
+    self.show_file_selection_menu(image_files, folder_name, "🗺️ Bilder", "🖼️")
 
-    def get_file_size_str(self, file_path):
-        """Get human-readable file size string"""
+def show_file_selection_menu(self, files, folder_name, title, icon):
+    """Generic file selection menu"""
+    menu_window = tk.Toplevel(self.root)
+    menu_window.title(f"{title} - {folder_name}")
+    menu_window.geometry(_centered_geometry(self, 600, 400))
+    menu_window.resizable(True, True)
+    menu_window.transient(self.root)
+    menu_window.grab_set()
+    
+    main_frame = ttk.Frame(menu_window)
+    main_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
+    
+    ttk.Label(main_frame, text=f"{title} auswählen", 
+                font=('Segoe UI', 14, 'bold')).pack(pady=(0, 15))
+    
+    # Scrollable list. Rows are inserted a page at a time as the user scrolls,
+    # and file sizes are read in a background thread and filled in as they arrive.
+    list_frame = ttk.Frame(main_frame)
+    list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
+    
+    tree = ttk.Treeview(list_frame, columns=('size',), show='tree headings',
+                        height=15, selectmode='browse')
+    tree.heading('#0', text='Datei', anchor=tk.W)
+    tree.heading('size', text='Größe', anchor=tk.E)
+    tree.column('size', width=90, anchor=tk.E, stretch=False)
+    scrollbar_y = ttk.Scrollbar(list_frame, orient="vertical", command=tree.yview)
+    scrollbar_x = ttk.Scrollbar(list_frame, orient="horizontal", command=tree.xview)
+    
+    file_sizes = {}
+    
+    def _insert_row(i, file_path):
+        tree.insert('', tk.END, iid=str(i), text=f"{icon} {os.path.basename(file_path)}",
+                    values=(file_sizes.get(i, "…"),))
+    
+    load_rows, _ = attach_scroll_paging(tree, scrollbar_y, files, _insert_row, 200)
+    tree.configure(xscrollcommand=scrollbar_x.set)
+    load_rows()
+    
+    def _show_sizes(batch):
         try:
-            size = os.path.getsize(file_path)
-            for unit in ['B', 'KB', 'MB', 'GB']:
-                if size < 1024.0:
-                    return f"{size:.1f} {unit}"
-                size /= 1024.0
-            return f"{size:.1f} TB"
-        except:
-            return "Unknown"
+            for i, size in batch:
+                file_sizes[i] = size
+                if tree.exists(str(i)):
+                    tree.set(str(i), 'size', size)
+        except tk.TclError:
+            pass  # Menu closed
+    
+    def _sizes():
+        for i, file_path in enumerate(files):
+            yield i, self.get_file_size_str(file_path)
+    
+    load_in_background(self.root, _sizes, _show_sizes)
+    
+    # Pack scrollbars and list
+    scrollbar_y.pack(side="right", fill="y")
+    scrollbar_x.pack(side="bottom", fill="x")
+    tree.pack(side="left", fill="both", expand=True)
+    
+    def _selected_file():
+        selection = tree.selection()
+        return files[int(selection[0])] if selection else None
+    
+    # Double-click to open
+    def on_double_click(event):
+        file_path = _selected_file()
+        if file_path:
+            self.open_file_with_system(file_path)
+            menu_window.destroy()
+    
+    tree.bind("<Double-Button-1>", on_double_click)
+    
+    # Buttons
+    button_frame = ttk.Frame(main_frame)
+    button_frame.pack(fill=tk.X)
+    
+    def open_selected():
+        file_path = _selected_file()
+        if file_path:
+            self.open_file_with_system(file_path)
+            menu_window.destroy()
+        else:
+            messagebox.showwarning("Keine Auswahl", "Bitte wählen Sie eine Datei aus.")
+    
+    ttk.Button(button_frame, text="Öffnen", command=open_selected).pack(side=tk.LEFT)
+    ttk.Button(button_frame, text="Alle öffnen", 
+                command=lambda: [self.open_file_with_system(f) for f in files]).pack(side=tk.LEFT, padx=(10, 0))
+    ttk.Button(button_frame, text="Schließen", 
+                command=menu_window.destroy).pack(side=tk.RIGHT)
+
+def get_file_size_str(self, file_path):
+    """Get human-readable file size string"""
+    try:
+        size = os.path.getsize(file_path)
+        for unit in ['B', 'KB', 'MB', 'GB']:
+            if size < 1024.0:
+                return f"{size:.1f} {unit}"
+            size /= 1024.0
+        return f"{size:.1f} TB"
+    except:
+        return "Unknown"
 
 def load_folder_results_for_analysis(self, folder_path, folder_name, parent_window):
     """Load results from folder into the application for further analysis"""
@@ -642,7 +730,7 @@ def load_folder_results_for_analysis(self, folder_path, folder_name, parent_wind
         messagebox.showerror("Fehler", f"Fehler beim Laden der Ergebnisse: {str(e)}")
 
 def refresh_results_window(self, window, results_dir):
-    """Refresh the results access window"""
+    """Refresh the results access window (unchanged folders are served from the file cache)"""
     try:
         window.destroy()
         self.show_results_access_panel()
@@ -659,13 +747,15 @@ def load_previous_video_results(self, event=None):
         # Get all video folders in results directory (if it exists)
         video_folders = []
         if os.path.exists(results_dir):
-            for item in os.listdir(results_dir):
-                folder_path = os.path.join(results_dir, item)
-                if os.path.isdir(folder_path):
-                    # Check if it has detection data files
-                    csv_path = os.path.join(folder_path, "detections.csv")
-                    if os.path.exists(csv_path):
-                        video_folders.append((item, folder_path, csv_path))
+            with os.scandir(results_dir) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    # Check if it has detection data files (served from the folder file cache)
+                    for csv_path in self.analyze_folder_files(entry.path)['csv']:
+                        if os.path.basename(csv_path).lower() == "detections.csv":
+                            video_folders.append((entry.name, entry.path, csv_path))
+                            break
         
         # Show selection dialog with both automatic and manual options
         self.show_video_folder_selection(video_folders, results_dir)
@@ -953,46 +1043,73 @@ def load_video_results_from_folder(self, folder_path, folder_name):
     except Exception as e:
         messagebox.showerror("Fehler", f"Fehler beim Laden der Ergebnisse: {str(e)}")
 
+def _classify_csv_column(col_name):
+    """Map a lower-cased CSV header to the event field it holds, or None"""
+    if 'einflug' in col_name or 'entry' in col_name:
+        return 'entry'
+    if 'ausflug' in col_name or 'exit' in col_name:
+        return 'exit'
+    if 'dauer' in col_name or 'duration' in col_name:
+        return 'duration'
+    return None
+
 def load_events_from_csv(self, csv_path):
-    """Load events from a CSV file"""
+    """Load events from a CSV file
+    
+    Parsed events are cached per file and reused while the file (mtime/size)
+    and the video frame rate are unchanged; callers get fresh dict copies.
+    """
     events = []
     try:
-        import csv
-        with open(csv_path, 'r', encoding='utf-8') as f:
+        fps = self.fps if hasattr(self, 'fps') and self.fps > 0 else 0
+        stat = os.stat(csv_path)
+        cache_key = (stat.st_mtime_ns, stat.st_size, fps)
+        
+        if not hasattr(self, '_csv_events_cache'):
+            self._csv_events_cache = {}
+        cached = self._csv_events_cache.get(csv_path)
+        if cached is not None and cached[0] == cache_key:
+            return [dict(event) for event in cached[1]]
+        
+        parse_time = self.parse_time_to_seconds
+        with open(csv_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
             reader = csv.reader(f)
-            header = None
+            columns = None
             
             for row in reader:
                 # Skip empty rows and metadata
                 if not row or row[0].startswith('#'):
                     continue
                 
-                # Find header row
-                if header is None:
-                    header = [col.lower().strip() for col in row]
+                # Find header row and resolve each column's field once
+                if columns is None:
+                    columns = [(i, field) for i, field in
+                               enumerate(_classify_csv_column(col.lower().strip()) for col in row)
+                               if field is not None]
                     continue
                 
                 # Parse event data
                 event = {}
-                for i, value in enumerate(row):
-                    if i < len(header):
-                        col_name = header[i]
-                        
-                        # Map CSV columns to event fields
-                        if 'einflug' in col_name or 'entry' in col_name:
-                            event['entry'] = self.parse_time_to_seconds(value)
-                            event['start_frame'] = event['entry'] * self.fps if hasattr(self, 'fps') and self.fps > 0 else 0
-                        elif 'ausflug' in col_name or 'exit' in col_name:
-                            event['exit'] = self.parse_time_to_seconds(value)
-                            event['end_frame'] = event['exit'] * self.fps if hasattr(self, 'fps') and self.fps > 0 else 0
-                        elif 'dauer' in col_name or 'duration' in col_name:
-                            try:
-                                if 's' in value:
-                                    event['duration'] = float(value.replace('s', '').strip())
-                                else:
-                                    event['duration'] = float(value)
-                            except ValueError:
-                                event['duration'] = 0
+                for i, field in columns:
+                    if i >= len(row):
+                        break
+                    value = row[i]
+                    
+                    # Map CSV columns to event fields
+                    if field == 'entry':
+                        event['entry'] = parse_time(value)
+                        event['start_frame'] = event['entry'] * fps
+                    elif field == 'exit':
+                        event['exit'] = parse_time(value)
+                        event['end_frame'] = event['exit'] * fps
+                    else:
+                        try:
+                            if 's' in value:
+                                event['duration'] = float(value.replace('s', '').strip())
+                            else:
+                                event['duration'] = float(value)
+                        except ValueError:
+                            event['duration'] = 0
                 
                 # Calculate duration if not provided
                 if 'duration' not in event and 'entry' in event and 'exit' in event:
@@ -1000,6 +1117,8 @@ def load_events_from_csv(self, csv_path):
                 
                 if 'entry' in event and 'exit' in event:
                     events.append(event)
+        
+        self._csv_events_cache[csv_path] = (cache_key, [dict(event) for event in events])
     
     except Exception as e:
         # Error loading events from CSV - handled internally
@@ -1120,12 +1239,20 @@ def show_loaded_events_window(self, events, folder_name):
     ttk.Button(button_frame, text="Schließen", 
                 command=events_window.destroy).pack(side=tk.RIGHT)
 
+@functools.lru_cache(maxsize=8192)
+def _format_mm_ss(whole_seconds):
+    """Format a non-negative whole number of seconds as MM:SS"""
+    mins, secs = divmod(whole_seconds, 60)
+    return f"{mins:02d}:{secs:02d}"
+
 def format_time(self, seconds):
     """Format seconds to MM:SS format"""
     if seconds is None:
         return "unbekannt"
     try:
         seconds = float(seconds)
+        if seconds >= 0:
+            return _format_mm_ss(int(seconds))
         mins = int(seconds // 60)
         secs = int(seconds % 60)
         return f"{mins:02d}:{secs:02d}"
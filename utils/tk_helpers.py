@@ -0,0 +1,88 @@
+"""
+Tkinter Helpers
+Screen metrics and incremental loading shared by the results and analysis history windows
+"""
+
+import threading
+import tkinter as tk
+
+
+def screen_size(self):
+    """Screen size in pixels, queried once per application"""
+    if not hasattr(self, '_cached_screen'):
+        self._cached_screen = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+    return self._cached_screen
+
+
+def attach_scroll_paging(widget, scrollbar, items, add_item, page_size):
+    """
+    Fill a scrollable widget a page at a time as the view nears its end
+
+    The widget's yscrollcommand is taken over (the scrollbar is still updated)
+    and add_item(index, item) is called for each item as its page is needed.
+    `items` is read on every page, so it may be refilled in place.
+
+    Args:
+        widget: Treeview or Canvas that is scrolled
+        scrollbar: Vertical scrollbar attached to the widget
+        items: Sequence of items to add
+        add_item: Callback creating the widget content for one item
+        page_size: Number of items added per page
+
+    Returns:
+        tuple: (load, reset) - load(count=page_size) adds the next items and
+        returns how many are loaded; reset() starts over after a refill
+    """
+    loaded = 0
+
+    def load(count=page_size):
+        nonlocal loaded
+        end = min(loaded + count, len(items))
+        for i in range(loaded, end):
+            add_item(i, items[i])
+        loaded = end
+        return loaded
+
+    def reset():
+        nonlocal loaded
+        loaded = 0
+
+    def on_yscroll(first, last):
+        scrollbar.set(first, last)
+        if float(last) > 0.9 and loaded < len(items):
+            try:
+                load()
+            except tk.TclError:
+                pass  # Window closed
+
+    widget.configure(yscrollcommand=on_yscroll)
+    return load, reset
+
+
+def load_in_background(root, produce, deliver, batch_size=50):
+    """
+    Run produce() on a daemon thread and hand its items to the Tk thread in batches
+
+    deliver(batch) is scheduled with root.after for every `batch_size` items.
+    It is called at least once, and the last call may get an empty batch, so
+    it can also clear a loading placeholder.
+
+    Args:
+        root: Tk root used to schedule deliveries
+        produce: Callable returning an iterable; runs off the Tk thread
+        deliver: Callback receiving a list of items on the Tk thread
+        batch_size: Number of items per delivery
+    """
+    def worker():
+        batch = []
+        try:
+            for item in produce():
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    root.after(0, deliver, batch)
+                    batch = []
+            root.after(0, deliver, batch)
+        except (tk.TclError, RuntimeError):
+            pass  # Application shutting down
+
+    threading.Thread(target=worker, daemon=True).start()
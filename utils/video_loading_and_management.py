@@ -39,10 +39,12 @@ def load_video(self, event=None):
             messagebox.showerror("Fehler", f"Fehler beim Öffnen der Dateiauswahl: {str(e)}")
             return
             
-        # Check if this video has been analyzed before
-        analysis_info = self.check_existing_analysis(self.video_path)
+        # Check if this video has been analyzed before (file details only if it was)
+        analysis_info = self.check_analysis_exists(self.video_path)
         
         if analysis_info["exists"]:
+            analysis_info = self.check_existing_analysis(self.video_path)
+            
             # Show analysis history dialog
             action = self.show_analysis_history_dialog(analysis_info)
             
@@ -92,6 +94,7 @@ def load_video_file(self, file_path=None):
         """Load video file and initialize basic properties"""
         if file_path:
             self.video_path = file_path
+        self.clear_video_caches()
         self.cap = cv2.VideoCapture(self.video_path)
         fps = self.cap.get(cv2.CAP_PROP_FPS)
         self.fps = fps if fps and fps > 0 else 30